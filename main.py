@@ -10,7 +10,7 @@ import threading
 import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, List
 
 from src.face_cropper import FaceCropper
 from src.image_pipeline import process_image
@@ -18,6 +18,7 @@ from src.video_pipeline import process_video
 from src.utils import (
     ManualCrop,
     ProcessingOptions,
+    encode_worker_limit,
     iter_media_files,
     is_image,
     is_video,
@@ -35,6 +36,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--quality", type=int, default=90)
     parser.add_argument("--crf", type=int, default=20)
     parser.add_argument("--preset", default="medium")
+    parser.add_argument(
+        "--encoder",
+        choices=["auto", "libx264", "h264_nvenc"],
+        default="auto",
+        help="Video-Encoder; 'auto' nutzt NVENC, wenn eine NVIDIA-GPU verfügbar ist",
+    )
     parser.add_argument("--min-face", type=float, default=0.1)
     parser.add_argument("--face-priority", choices=["largest", "center", "all"], default="largest")
     parser.add_argument("--threads", type=int, default=4)
@@ -78,6 +85,7 @@ def build_options(args: argparse.Namespace) -> ProcessingOptions:
         quality=args.quality,
         crf=args.crf,
         preset=args.preset,
+        video_encoder=args.encoder,
         mode=args.mode,
         crop_x=args.crop_x,
         crop_y=args.crop_y,
@@ -97,13 +105,20 @@ def build_options(args: argparse.Namespace) -> ProcessingOptions:
     )
 
 
-def _process_images(
-    images: List[Path],
+# Videos hold a decoder, a tracker and an ffmpeg child each; two at a time keep the
+# cores busy without thrashing memory (same limit as the GUI).
+VIDEO_WORKERS = 2
+
+
+def _run_parallel(
+    files: List[Path],
     options: ProcessingOptions,
     logger: logging.Logger,
-    manual_overrides: dict[Path, ManualCrop] | None = None,
+    workers: int,
+    label: str,
+    handler: Callable[[Path, FaceCropper | None], object],
 ) -> None:
-    if not images:
+    if not files:
         return
     thread_local = threading.local()
     detectors: List[FaceCropper] = []
@@ -123,45 +138,46 @@ def _process_images(
                 detectors.append(detector)
         return detector
 
-    def _worker(path: Path) -> Path:
-        detector = _get_detector()
-        override = manual_overrides.get(path) if manual_overrides else None
-        result = process_image(path, options, detector, manual_crop=override)
-        return result.target
+    def _worker(path: Path) -> None:
+        handler(path, _get_detector())
 
-    with ThreadPoolExecutor(max_workers=options.threads or 1) as executor:
-        futures = {executor.submit(_worker, image): image for image in images}
+    workers = encode_worker_limit(options, min(workers, len(files)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_worker, path): path for path in files}
         for future in as_completed(futures):
             try:
                 future.result()
             except Exception as exc:
-                logger.exception("Fehler bei Bild %s: %s", futures[future], exc)
+                logger.exception("Fehler bei %s %s: %s", label, futures[future], exc)
     for detector in detectors:
         detector.close()
 
 
+def _process_images(
+    images: List[Path],
+    options: ProcessingOptions,
+    logger: logging.Logger,
+    manual_overrides: dict[Path, ManualCrop] | None = None,
+) -> None:
+    def _handle(path: Path, detector: FaceCropper | None) -> None:
+        override = manual_overrides.get(path) if manual_overrides else None
+        process_image(path, options, detector, manual_crop=override)
+
+    _run_parallel(images, options, logger, options.threads or 1, "Bild", _handle)
+
+
 def _process_videos(
-    videos: Iterable[Path],
+    videos: List[Path],
     options: ProcessingOptions,
     logger: logging.Logger,
 ) -> None:
-    if not videos:
-        return
-    face_cropper = (
-        FaceCropper(
-            min_face=options.min_face,
-            face_priority=options.face_priority,
-        )
-        if options.face_detection_enabled
-        else None
-    )
-    for video in videos:
-        try:
-            process_video(video, options, face_cropper)
-        except Exception as exc:
-            logger.exception("Fehler bei Video %s: %s", video, exc)
-    if face_cropper:
-        face_cropper.close()
+    # Each worker thread keeps its own FaceCropper, so a tracker only ever sees the
+    # frames of one video at a time.
+    def _handle(path: Path, detector: FaceCropper | None) -> None:
+        process_video(path, options, detector)
+
+    workers = min(VIDEO_WORKERS, options.threads or 1)
+    _run_parallel(videos, options, logger, workers, "Video", _handle)
 
 
 def run_cli(args: argparse.Namespace) -> None:
@@ -0,0 +1,78 @@
+"""Worker entry points for the GUI's batch conversion.
+
+Kept free of Tkinter: spawned pool workers import this module to unpickle their
+tasks, and should not pay for loading the whole GUI to run a pipeline.
+"""
+from __future__ import annotations
+
+import contextlib
+import multiprocessing.util
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .utils import ManualCrop, ProcessingOptions, is_image, is_video, safe_output_path
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from .face_cropper import FaceCropper
+
+
+_WORKER_CROPPER: Optional[FaceCropper] = None
+
+
+def init_worker(options: ProcessingOptions) -> None:
+    """Legt pro Worker-Prozess einen eigenen FaceCropper an."""
+
+    import cv2
+
+    from .face_cropper import FaceCropper
+
+    global _WORKER_CROPPER
+    # Parallelität kommt aus dem Pool; OpenCV-Threads pro Prozess würden die Kerne überbuchen.
+    cv2.setNumThreads(1)
+    if options.face_detection_enabled:
+        _WORKER_CROPPER = FaceCropper(
+            min_face=options.min_face,
+            face_priority=options.face_priority,
+        )
+        # Pool-Worker beenden sich ohne atexit; Finalize läuft trotzdem beim Prozessende.
+        multiprocessing.util.Finalize(None, _WORKER_CROPPER.close, exitpriority=10)
+
+
+def process_one(
+    path: Path,
+    options: ProcessingOptions,
+    manual_override: Optional[ManualCrop],
+    face_cropper: Optional[FaceCropper] = None,
+    source_image: Optional[Image.Image] = None,
+) -> Path:
+    cropper = face_cropper if face_cropper is not None else _WORKER_CROPPER
+    if is_image(path):
+        from .image_pipeline import process_image
+
+        process_image(
+            path, options, cropper, manual_crop=manual_override, source_image=source_image
+        )
+    elif is_video(path):
+        from .video_pipeline import process_video
+
+        process_video(path, options, cropper)
+    return path
+
+
+def discard_unfinished(paths: Iterable[Path], options: ProcessingOptions, since: float) -> None:
+    """Remove the clips that cancelled jobs for ``paths`` left half-written.
+
+    Only files modified after ``since`` go, so results from earlier runs stay.
+    """
+
+    video_suffix = f".{options.video_ext.lower()}"
+    for path in paths:
+        # Images and videos both end up as a clip with the video extension.
+        target = safe_output_path(
+            options.output_dir, path, options.size, options.image_format, options.video_ext
+        ).with_suffix(video_suffix)
+        with contextlib.suppress(OSError):  # missing, or still held open on Windows
+            if target.stat().st_mtime >= since:
+                target.unlink()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import contextlib
 import math
+import threading
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -66,6 +67,10 @@ class FaceCropper:
         self.max_step_fraction = max(0.0, float(max_step_fraction))
         self._last_smoothed: Optional[CropBox] = None
         self._lost_frames = 0
+        # MediaPipe graphs and OpenCV detectors must not run concurrently; the lock lets
+        # the GUI share one instance between preview analysis and conversion. It only
+        # covers detection: track() state belongs to a single caller at a time.
+        self._lock = threading.Lock()
 
         self._use_mediapipe = mp is not None
         self._face_detection: Optional["mp.solutions.face_detection.FaceDetection"] = None
@@ -103,9 +108,16 @@ class FaceCropper:
 
     def close(self) -> None:
         if self._use_mediapipe and self._face_detection is not None:
-            with contextlib.suppress(Exception):
+            with self._lock, contextlib.suppress(Exception):
                 self._face_detection.close()
 
+    def reset_tracking(self) -> None:
+        """Forget the previous video's crop so the next one starts untracked."""
+
+        self._last_smoothed = None
+        self._lost_frames = 0
+        self.smoother.reset()
+
     def _load_optional_cascade(self, filename: str) -> Optional[cv2.CascadeClassifier]:
         path = cv2.data.haarcascades + filename
         cascade = cv2.CascadeClassifier(path)
@@ -390,21 +402,22 @@ class FaceCropper:
         return CropBox(x=x, y=y, size=size)
 
     def detect_subjects(self, image: np.ndarray) -> List[DetectionResult]:
-        detections: List[DetectionResult] = []
-        if self._use_mediapipe:
-            detections.extend(self._detect_with_mediapipe(image))
-        else:
-            detections.extend(self._detect_with_cascade(image))
-        best_score = max((det.score for det in detections), default=0.0)
-        extra_people: List[DetectionResult] = []
-        if best_score < 0.6 or len(detections) < 1:
-            extra_people = self._detect_people(image)
-            if extra_people:
-                detections.extend(extra_people)
-        if not detections and extra_people:
-            detections = extra_people
-        if not detections:
-            detections = self._detect_saliency(image)
+        with self._lock:
+            detections: List[DetectionResult] = []
+            if self._use_mediapipe:
+                detections.extend(self._detect_with_mediapipe(image))
+            else:
+                detections.extend(self._detect_with_cascade(image))
+            best_score = max((det.score for det in detections), default=0.0)
+            extra_people: List[DetectionResult] = []
+            if best_score < 0.6 or len(detections) < 1:
+                extra_people = self._detect_people(image)
+                if extra_people:
+                    detections.extend(extra_people)
+            if not detections and extra_people:
+                detections = extra_people
+            if not detections:
+                detections = self._detect_saliency(image)
         return self._merge_detections(detections)
 
     def select_detection(self, detections: List[DetectionResult], width: int, height: int) -> Optional[DetectionResult]:
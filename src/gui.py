@@ -4,16 +4,22 @@ from __future__ import annotations
 
 import json
 import math
+import multiprocessing
 import os
+import queue
 import random
 import subprocess
 import sys
 import threading
+import time
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from PIL import Image, ImageDraw, ImageTk
 try:  # Pillow 9.1+
@@ -22,28 +28,74 @@ except ImportError:  # pragma: no cover - fallback for very old Pillow
     ImageOps = None  # type: ignore[assignment]
 
 try:  # Pillow 9.1+
-    RESAMPLE_LANCZOS = Image.Resampling.LANCZOS  # type: ignore[attr-defined]
+    RESAMPLE_BICUBIC = Image.Resampling.BICUBIC  # type: ignore[attr-defined]
+    RESAMPLE_BILINEAR = Image.Resampling.BILINEAR  # type: ignore[attr-defined]
 except AttributeError:  # pragma: no cover - Pillow < 9.1
-    RESAMPLE_LANCZOS = Image.LANCZOS
+    RESAMPLE_BICUBIC = Image.BICUBIC
+    RESAMPLE_BILINEAR = Image.BILINEAR
 
-from .face_cropper import FaceCropper
-from .image_pipeline import determine_crop_box, determine_motion_manual, process_image
+from .batch_worker import discard_unfinished, init_worker, process_one
 from .utils import (
     CropBox,
     ManualCrop,
     ProcessingOptions,
     ORIENTATION_CIRCLE_MARGIN,
+    SUPPORTED_IMAGE_EXTS,
+    SUPPORTED_VIDEO_EXTS,
     clamp,
     crop_position_bounds,
+    encode_worker_limit,
     ensure_dir,
     iter_media_files,
     is_image,
     is_video,
     max_crop_size,
     normalize_crop_with_overflow,
+    register_heif_opener,
     setup_environment,
 )
-from .video_pipeline import process_video
+
+if TYPE_CHECKING:
+    from .face_cropper import FaceCropper
+
+# Gesichtserkennung (MediaPipe/OpenCV) und die ffmpeg-Pipelines werden erst bei
+# Bedarf importiert, damit das Fenster ohne deren Ladezeit erscheint.
+
+PreviewKey = tuple[Optional[Path], int, int]
+
+# Direction in which a resize handle grows the crop along x and y.
+_HANDLE_SIGNS: dict[str, tuple[float, float]] = {
+    "se": (1.0, 1.0),
+    "sw": (-1.0, 1.0),
+    "ne": (1.0, -1.0),
+    "nw": (-1.0, -1.0),
+}
+
+
+def _open_image(path: Path) -> Image.Image:
+    """``Image.open`` that registers the HEIF plugin on first use."""
+
+    if path.suffix.lower() in (".heic", ".heif"):
+        register_heif_opener()
+    return Image.open(path)
+
+
+@lru_cache(maxsize=256)
+def _default_output_for(path: Path) -> Path:
+    if path.is_file():
+        return path.parent / f"Converted {path.stem}"
+    return path.parent / f"Converted {path.name}"
+
+
+@dataclass(slots=True)
+class _DragState:
+    target: str
+    mode: str
+    handle: Optional[str]
+    start: CropBox
+    start_x: float
+    start_y: float
+    moved: bool = False
 
 
 @dataclass
@@ -74,8 +126,19 @@ class Application(tk.Tk):
     """Tkinter-Anwendung mit Vorschau und manueller Zuschnittssteuerung."""
 
     CANVAS_SIZE = 520
+    CANVAS_BACKGROUND = "#060d1d"
+    PREVIEW_RESAMPLE = RESAMPLE_BICUBIC
     CIRCLE_MARGIN = ORIENTATION_CIRCLE_MARGIN
     PREVIEW_OVERFLOW_RATIO = 0.02
+    SLIDER_RENDER_DELAY_MS = 40
+    PREVIEW_CACHE_SIZE = 8
+    SOURCE_CACHE_SIZE = 5
+    PROGRESS_INTERVAL = 0.1
+    THUMBNAIL_BATCH = 16
+    IMPORT_MESSAGE = "Importiere Eingabe…"
+    VIDEO_WORKERS = 2
+    # How often a pooled batch checks whether it was cancelled (seconds).
+    CANCEL_POLL_INTERVAL = 0.2
     MOTION_DIRECTION_CHOICES = [
         ("in", "Reinzoomen"),
         ("out", "Rauszoomen"),
@@ -100,25 +163,62 @@ class Application(tk.Tk):
 
         self.input_path: Optional[Path] = None
         self.media_files: list[Path] = []
+        self._media_cache: dict[Path, list[Path]] = {}
+        self._media_load_token: Optional[object] = None
         self.image_files: list[Path] = []
+        self._image_index: dict[Path, int] = {}
         self.manual_crops: dict[Path, ManualCrop] = {}
         self._auto_generated_paths: set[Path] = set()
+        self._auto_manual_cache: dict[tuple[Path, bool, str], ManualCrop] = {}
         self._list_paths: list[Path] = []
         self._list_iids: list[str] = []
+        self._list_index: dict[Path, int] = {}
+        self._iid_index: dict[str, int] = {}
         self._thumbnail_cache: dict[Path, ImageTk.PhotoImage] = {}
         self._video_thumbnail: Optional[ImageTk.PhotoImage] = None
+        self._placeholder_thumbnail: Optional[ImageTk.PhotoImage] = None
+        self._thumbnail_token: Optional[object] = None
+        self._thumbnail_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="thumbnails")
         self.current_path: Optional[Path] = None
         self.current_image: Optional[Image.Image] = None
+        self._current_size: tuple[int, int] = (0, 0)
+        self._current_max_side = 1
         self._tk_image: Optional[ImageTk.PhotoImage] = None
+        self._front_image: Optional[ImageTk.PhotoImage] = None
+        self._back_image: Optional[ImageTk.PhotoImage] = None
+        self._canvas_image_id = 0
+        self._image_item_visible = False
+        self._crop_item_ids: dict[str, tuple[int, int, int]] = {}
+        self._handle_ids: list[int] = []
+        self._nav_item_ids: dict[str, tuple[int, int]] = {}
+        self._nav_prev_enabled = False
+        self._nav_next_enabled = False
+        self._nav_item_state: Optional[tuple[bool, bool, bool]] = None
+        self._start_items_visible = False
+        self._render_token: Optional[object] = None
+        self._preview_cache: OrderedDict[PreviewKey, Image.Image] = OrderedDict()
+        self._displayed_frame_key: Optional[PreviewKey] = None
+        self._pending_frame_key: Optional[PreviewKey] = None
+        self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview-render")
+        self._load_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview-load")
+        self._preview_request_id = 0
+        self._loading_path: Optional[Path] = None
+        # Decoded preview sources of recently shown and neighbouring images.
+        self._source_cache: OrderedDict[Path, tuple[Image.Image, tuple[int, int]]] = OrderedDict()
+        self._prefetching: set[Path] = set()
+        self._prefetch_token = object()
         self._preview_cropper: Optional[FaceCropper] = None
         self._updating_controls = False
         self.output_media_files: list[Path] = []
+        self.output_listbox: Optional[tk.Listbox] = None
+        self._output_parent: Optional[ttk.Frame] = None
         self._legend_items: dict[str, dict[str, object]] = {}
         self._start_color = "#00ff88"
         self._end_color = "#ff5555"
         self._legend_colors = {"start": self._start_color, "end": self._end_color}
         self._crop_buttons: dict[str, ttk.Button] = {}
         self._crop_buttons_enabled = True
+        self._overlay_ui_state: Optional[tuple[bool, bool, str]] = None
         self._tutorial_window: Optional[tk.Toplevel] = None
         self._tutorial_steps: list[dict[str, object]] = []
         self._tutorial_index = -1
@@ -128,6 +228,7 @@ class Application(tk.Tk):
         self._regulator_frame: Optional[ttk.Frame] = None
         self._dpad_frame: Optional[ttk.Frame] = None
         self._compact_control_buttons: list[tk.Widget] = []
+        self._control_widgets: list[ttk.Widget] = []
         self.crop_button_frame: Optional[ttk.Frame] = None
         self.legend_frame: Optional[tk.Widget] = None
         self._loading_overlay: Optional[tk.Frame] = None
@@ -136,6 +237,7 @@ class Application(tk.Tk):
         self._auto_task_token: Optional[object] = None
         self._bulk_auto_token: Optional[object] = None
         self._bulk_auto_thread: Optional[threading.Thread] = None
+        self._batch_token: Optional[object] = None
         self._memory_container: Optional[ttk.Frame] = None
         self._memory_game_state: Optional[MemoryGameState] = None
         self._memory_flip_job: Optional[str] = None
@@ -151,6 +253,11 @@ class Application(tk.Tk):
         self.offset_y = tk.DoubleVar(value=0.0)
         self.motion_enabled_var = tk.BooleanVar(value=True)
         self.active_crop_var = tk.StringVar(value="end")
+        # Plain mirrors of the two variables for the render and drag paths.
+        self._motion_enabled = True
+        self._active_crop = "end"
+        self.motion_enabled_var.trace_add("write", self._sync_crop_vars)
+        self.active_crop_var.trace_add("write", self._sync_crop_vars)
         self.motion_direction_var = tk.StringVar(value="in")
         self._motion_direction_label_by_value = {
             value: label for value, label in self.MOTION_DIRECTION_CHOICES
@@ -169,7 +276,10 @@ class Application(tk.Tk):
         self._canvas_scale = 1.0
         self._canvas_offset = (0.0, 0.0)
         self._manual_display: dict[str, tuple[float, float, float, float]] = {}
-        self._drag_state: Optional[dict[str, object]] = None
+        self._drag_state: Optional[_DragState] = None
+        self._drag_pending = False
+        self._last_drag_position: Optional[tuple[int, int]] = None
+        self._pending_render_id: Optional[str] = None
         self._conversion_active = False
 
         self._build_layout()
@@ -357,7 +467,8 @@ class Application(tk.Tk):
             self._show_placeholder("Kein Bild ausgewählt.")
             return
         try:
-            self._load_preview(self._normalize_path(reference))
+            path = self._normalize_path(reference)
+            self._apply_preview(path, *self._open_preview_image(path))
         except Exception:
             self._show_placeholder("Kein Bild ausgewählt.")
             return
@@ -708,7 +819,7 @@ class Application(tk.Tk):
             preview,
             width=self.CANVAS_SIZE,
             height=self.CANVAS_SIZE,
-            background="#060d1d",
+            background=self.CANVAS_BACKGROUND,
             highlightthickness=0,
             bd=0,
         )
@@ -716,9 +827,48 @@ class Application(tk.Tk):
         self.canvas.bind("<ButtonPress-1>", self._on_canvas_press)
         self.canvas.bind("<B1-Motion>", self._on_canvas_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_canvas_release)
+        self._create_canvas_items()
 
         self._create_loading_overlay(preview)
-        output = ttk.Frame(main, style="Card.TFrame", padding=20)
+        self._output_parent = main
+        self.after_idle(self._build_output_panel)
+
+        bottom = ttk.Frame(main)
+        bottom.grid(row=2, column=0, columnspan=3, sticky="ew", pady=(16, 0))
+        bottom.columnconfigure(0, weight=1)
+
+        ttk.Label(bottom, textvariable=self.progress_var, style="Status.TLabel").grid(row=0, column=0, sticky="w")
+        buttons = ttk.Frame(bottom)
+        buttons.grid(row=0, column=1, sticky="e")
+        self.convert_selected_button = ttk.Button(
+            buttons,
+            text="Nur aktuelles Bild",
+            command=self._on_convert_selected,
+        )
+        self.convert_selected_button.grid(row=0, column=0, sticky="e", padx=(0, 8))
+        self.convert_button = ttk.Button(buttons, text="Alle konvertieren", command=self._on_convert, style="Accent.TButton")
+        self.convert_button.grid(row=0, column=1, sticky="e")
+
+        self._control_widgets = [
+            self.size_scale,
+            self.x_scale,
+            self.y_scale,
+            *self._compact_control_buttons,
+            self.prev_button,
+            self.next_button,
+        ]
+        self._set_controls_enabled(False)
+        self._refresh_output_list()
+        self._refresh_legend_state()
+        self._update_settings_toggle_button()
+
+    def _build_output_panel(self) -> None:
+        """Create the output column once the window has been painted."""
+
+        if self.output_listbox is not None or self._output_parent is None:
+            return
+        parent = self._output_parent
+        output = ttk.Frame(parent, style="Card.TFrame", padding=20)
         output.grid(row=1, column=2, sticky="nsw", padx=(16, 0), pady=(16, 0))
         output.columnconfigure(0, weight=1)
         output.rowconfigure(1, weight=1)
@@ -745,27 +895,8 @@ class Application(tk.Tk):
             sticky="w",
             pady=(12, 0),
         )
-
-        bottom = ttk.Frame(main)
-        bottom.grid(row=2, column=0, columnspan=3, sticky="ew", pady=(16, 0))
-        bottom.columnconfigure(0, weight=1)
-
-        ttk.Label(bottom, textvariable=self.progress_var, style="Status.TLabel").grid(row=0, column=0, sticky="w")
-        buttons = ttk.Frame(bottom)
-        buttons.grid(row=0, column=1, sticky="e")
-        self.convert_selected_button = ttk.Button(
-            buttons,
-            text="Nur aktuelles Bild",
-            command=self._on_convert_selected,
-        )
-        self.convert_selected_button.grid(row=0, column=0, sticky="e", padx=(0, 8))
-        self.convert_button = ttk.Button(buttons, text="Alle konvertieren", command=self._on_convert, style="Accent.TButton")
-        self.convert_button.grid(row=0, column=1, sticky="e")
-
-        self._set_controls_enabled(False)
-        self._refresh_output_list()
-        self._refresh_legend_state()
-        self._update_settings_toggle_button()
+        if self.output_media_files:
+            self.output_listbox.insert(tk.END, *(f"🎬 {media.name}" for media in self.output_media_files))
 
     def _toggle_settings_panel(self) -> None:
         self._set_settings_collapsed(not self._settings_collapsed)
@@ -860,8 +991,8 @@ class Application(tk.Tk):
             number_label: tk.Label = widgets["number"]  # type: ignore[assignment]
             text_label: ttk.Label = widgets["text"]  # type: ignore[assignment]
             color = self._legend_colors.get(key, "#ffffff")
-            enabled = key == "end" or self.motion_enabled_var.get()
-            is_active = enabled and self.active_crop_var.get() == key
+            enabled = key == "end" or self._motion_enabled
+            is_active = enabled and self._active_crop == key
             if enabled:
                 number_label.configure(cursor="hand2")
                 text_label.configure(cursor="hand2")
@@ -908,7 +1039,7 @@ class Application(tk.Tk):
             return
         self.offset_x.set(clamp(x_value, 0.0, 1.0))
         self.offset_y.set(clamp(y_value, 0.0, 1.0))
-        self._on_slider_change(0.0)
+        self._schedule_slider_apply()
 
     def _adjust_offset(self, delta_x: float, delta_y: float) -> None:
         if self.current_image is None:
@@ -929,7 +1060,7 @@ class Application(tk.Tk):
             self.MAX_ZOOM_RATIO,
         )
         self.size_ratio.set(new_ratio)
-        self._on_slider_change(0.0)
+        self._schedule_slider_apply()
 
     def _refresh_crop_buttons(self) -> None:
         if not self._crop_buttons:
@@ -943,12 +1074,12 @@ class Application(tk.Tk):
         for key, button in self._crop_buttons.items():
             base_style = "Start.TButton" if key == "start" else "End.TButton"
             active_style = "StartActive.TButton" if key == "start" else "EndActive.TButton"
-            if key == "start" and not self.motion_enabled_var.get():
+            if key == "start" and not self._motion_enabled:
                 button.state(["disabled"])
                 button.configure(style=base_style)
                 continue
             button.state(["!disabled"])
-            style = active_style if self.active_crop_var.get() == key else base_style
+            style = active_style if self._active_crop == key else base_style
             button.configure(style=style)
 
     def _select_crop(self, target: str) -> None:
@@ -1140,24 +1271,18 @@ class Application(tk.Tk):
             self._tutorial_window = None
 
     def _normalize_path(self, path: Path) -> Path:
+        return Path(os.path.normpath(os.path.abspath(os.fspath(path))))
+
+    def _resolve_path(self, path: Path) -> Path:
         try:
             return path.resolve()
         except OSError:
-            return path
+            return self._normalize_path(path)
 
     def _set_controls_enabled(self, enabled: bool) -> None:
-        for scale in (self.size_scale, self.x_scale, self.y_scale):
-            if enabled:
-                scale.state(["!disabled"])
-            else:
-                scale.state(["disabled"])
-        for button in self._compact_control_buttons:
-            if enabled:
-                button.state(["!disabled"])
-            else:
-                button.state(["disabled"])
-        self.prev_button.state(["!disabled"] if enabled else ["disabled"])
-        self.next_button.state(["!disabled"] if enabled else ["disabled"])
+        state = ["!disabled"] if enabled else ["disabled"]
+        for widget in self._control_widgets:
+            widget.state(state)
         self._crop_buttons_enabled = enabled
         if enabled:
             self._refresh_selected_button_state()
@@ -1165,47 +1290,90 @@ class Application(tk.Tk):
             self.convert_selected_button.state(["disabled"])
         self._refresh_crop_buttons()
         self._refresh_legend_state()
-        self.listbox.state(["!disabled"])
 
     def _refresh_selected_button_state(self) -> None:
         if self._conversion_active:
             self.convert_selected_button.state(["disabled"])
             return
-        if self.current_path is not None and self.current_path in self.image_files:
+        if self.current_path is not None and self.current_path in self._image_index:
             self.convert_selected_button.state(["!disabled"])
         else:
             self.convert_selected_button.state(["disabled"])
 
     def _thumbnail_for(self, path: Path) -> ImageTk.PhotoImage:
+        """Return the cached thumbnail, or a placeholder until the background job delivers it."""
+
         if is_image(path):
             thumbnail = self._thumbnail_cache.get(path)
             if thumbnail is None:
-                thumbnail = self._create_image_thumbnail(path)
-                self._thumbnail_cache[path] = thumbnail
+                return self._get_placeholder_thumbnail()
             return thumbnail
         return self._get_video_thumbnail()
 
-    def _create_image_thumbnail(self, path: Path, size: int = 48) -> ImageTk.PhotoImage:
+    def _start_thumbnail_job(self, items: list[tuple[str, Path]]) -> None:
+        """Decode list thumbnails on a worker and hand them over in small batches."""
+
+        token = object()
+        self._thumbnail_token = token
+        if not items:
+            return
+
+        def job() -> None:
+            batch: list[tuple[str, Path, Image.Image]] = []
+            for iid, path in items:
+                if token is not self._thumbnail_token:
+                    return
+                batch.append((iid, path, self._compose_image_thumbnail(path)))
+                if len(batch) >= self.THUMBNAIL_BATCH:
+                    self.after(0, self._apply_thumbnails, token, batch)
+                    batch = []
+            if batch:
+                self.after(0, self._apply_thumbnails, token, batch)
+
+        self._thumbnail_executor.submit(job)
+
+    def _apply_thumbnails(
+        self, token: object, batch: list[tuple[str, Path, Image.Image]]
+    ) -> None:
+        if token is not self._thumbnail_token:
+            return
+        for iid, path, image in batch:
+            thumbnail = ImageTk.PhotoImage(image)
+            self._thumbnail_cache[path] = thumbnail
+            if self.listbox.exists(iid):
+                self.listbox.item(iid, image=thumbnail)
+
+    def _compose_image_thumbnail(self, path: Path, size: int = 48) -> Image.Image:
         border_color = "#1b2032"
         background_color = "#0b0f1c"
         max_content = size - 8
         content_size = (max_content, max_content)
         try:
-            with Image.open(path) as img:
+            with _open_image(path) as img:
+                img.draft("RGB", content_size)
                 image = img.convert("RGB")
         except Exception:
             image = Image.new("RGB", content_size, "#2a3149")
         else:
-            if ImageOps is not None:
-                image = ImageOps.contain(image, content_size, RESAMPLE_LANCZOS)
-            else:  # pragma: no cover - fallback for older Pillow
-                image.thumbnail(content_size, RESAMPLE_LANCZOS)
+            # thumbnail() box-reduces before resampling, which matters for large
+            # non-JPEG sources; contain() is only needed to upscale tiny images.
+            image.thumbnail(content_size, RESAMPLE_BICUBIC)
+            if ImageOps is not None and max(image.size) < max_content:
+                image = ImageOps.contain(image, content_size, RESAMPLE_BICUBIC)
         thumb = Image.new("RGB", (size, size), background_color)
         draw = ImageDraw.Draw(thumb)
         draw.rectangle((0, 0, size - 1, size - 1), outline=border_color)
         offset = ((size - image.width) // 2, (size - image.height) // 2)
         thumb.paste(image, offset)
-        return ImageTk.PhotoImage(thumb)
+        return thumb
+
+    def _get_placeholder_thumbnail(self, size: int = 48) -> ImageTk.PhotoImage:
+        if self._placeholder_thumbnail is None:
+            thumb = Image.new("RGB", (size, size), "#0b0f1c")
+            draw = ImageDraw.Draw(thumb)
+            draw.rectangle((0, 0, size - 1, size - 1), outline="#1b2032")
+            self._placeholder_thumbnail = ImageTk.PhotoImage(thumb)
+        return self._placeholder_thumbnail
 
     def _get_video_thumbnail(self, size: int = 48) -> ImageTk.PhotoImage:
         if self._video_thumbnail is None:
@@ -1234,33 +1402,43 @@ class Application(tk.Tk):
     def _list_selection_indices(self) -> list[int]:
         indices: list[int] = []
         for iid in self.listbox.selection():
-            try:
-                position = self._list_iids.index(iid)
-            except ValueError:
-                continue
-            indices.append(position)
+            position = self._iid_index.get(iid)
+            if position is not None:
+                indices.append(position)
         return indices
 
-    def _default_output_for(self, path: Path) -> Path:
-        if path.is_file():
-            return path.parent / f"Converted {path.stem}"
-        return path.parent / f"Converted {path.name}"
-
     def _resolve_output_dir(self) -> Optional[Path]:
         raw = self.output_var.get().strip()
         if not raw and self.input_path:
-            return self._default_output_for(self.input_path)
+            return _default_output_for(self.input_path)
         if not raw:
             return None
         return Path(raw).expanduser()
 
     def _get_preview_cropper(self) -> Optional[FaceCropper]:
         if self._preview_cropper is None:
+            from .face_cropper import FaceCropper
+
             self._preview_cropper = FaceCropper()
         return self._preview_cropper
 
+    def _adopt_batch_cropper(self, cropper: FaceCropper) -> None:
+        # The GUI's batch options use the detector defaults, like _get_preview_cropper.
+        if self._preview_cropper is None:
+            self._preview_cropper = cropper
+        else:
+            cropper.close()
+
     def destroy(self) -> None:  # pragma: no cover - GUI shutdown
         self._destroy_tutorial_window()
+        self._render_token = None
+        self._render_executor.shutdown(wait=False, cancel_futures=True)
+        self._load_executor.shutdown(wait=False, cancel_futures=True)
+        self._thumbnail_token = None
+        self._thumbnail_executor.shutdown(wait=False, cancel_futures=True)
+        # Dropping the token cancels a running conversion: pooled workers are
+        # terminated, a serial run stops before its next file.
+        self._batch_token = None
         if self._preview_cropper is not None:
             self._preview_cropper.close()
             self._preview_cropper = None
@@ -1299,61 +1477,117 @@ class Application(tk.Tk):
             self._refresh_output_list()
 
     def _set_input_path(self, path: Path) -> None:
-        self.input_path = self._normalize_path(path)
+        self.input_path = self._resolve_path(path)
         self.input_var.set(str(self.input_path))
-        default_output = self._default_output_for(self.input_path)
+        default_output = _default_output_for(self.input_path)
         self.output_var.set(str(default_output))
         self.manual_crops.clear()
         self._auto_generated_paths.clear()
+        self._auto_manual_cache.clear()
+        self._media_cache.pop(self.input_path, None)
         self._load_media_files()
         self._refresh_output_list()
 
     def _load_media_files(self) -> None:
-        import_message = "Importiere Eingabe…"
-        self._show_loading_overlay(import_message)
-        self.update_idletasks()
+        """Reset the list and walk the input on a worker; large folders keep the UI responsive."""
+
+        self._show_loading_overlay(self.IMPORT_MESSAGE)
+        self._media_load_token = None
         try:
             self.media_files.clear()
             self.image_files.clear()
+            self._image_index.clear()
             for item in self.listbox.get_children():
                 self.listbox.delete(item)
             self._list_paths.clear()
             self._list_iids.clear()
+            self._list_index.clear()
+            self._iid_index.clear()
             self._thumbnail_cache.clear()
-            self.canvas.delete("all")
+            self._thumbnail_token = None
+            self._preview_cache.clear()
+            self._source_cache.clear()
+            self._prefetching.clear()
+            self._prefetch_token = object()
+            self._hide_canvas_items()
+            self._cancel_preview_load()
             self.current_path = None
-            self.current_image = None
+            self._set_current_image(None)
             self._tk_image = None
+            self._render_token = None
+            self._pending_frame_key = None
             self.crop_info_var.set("Kein Bild ausgewählt.")
             self._set_controls_enabled(False)
             self.position_var.set("0/0")
 
             if not self.input_path:
+                self._hide_import_overlay()
                 return
+        except Exception:
+            self._hide_import_overlay()
+            raise
+
+        input_path = self.input_path
+        token = object()
+        self._media_load_token = token
 
-            files = [self._normalize_path(path) for path in iter_media_files(self.input_path)]
-            files.sort()
+        def worker() -> None:
+            try:
+                # input_path is already resolved and iter_media_files joins onto it, so
+                # the results need no further normalisation.
+                files = sorted(iter_media_files(input_path))
+            except OSError as exc:
+                self.after(0, lambda error=exc: self._on_media_files_failed(token, error))
+                return
+            self.after(0, lambda: self._populate_media_files(token, input_path, files))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _hide_import_overlay(self) -> None:
+        if self._loading_message_var.get() == self.IMPORT_MESSAGE:
+            self._hide_loading_overlay()
+
+    def _on_media_files_failed(self, token: object, exc: OSError) -> None:
+        if token is not self._media_load_token:
+            return
+        self._media_load_token = None
+        self._hide_import_overlay()
+        self.progress_var.set(f"Eingabe kann nicht gelesen werden: {exc}")
+        self._show_placeholder("Keine Bilder verfügbar.")
+
+    def _populate_media_files(self, token: object, input_path: Path, files: list[Path]) -> None:
+        if token is not self._media_load_token or input_path != self.input_path:
+            return
+        self._media_load_token = None
+        try:
             self.media_files = files
+            self._media_cache[input_path] = list(files)
             base_for_display = (
                 self.input_path if self.input_path.is_dir() else self.input_path.parent
             )
+            prefix = os.path.join(str(base_for_display), "")
+            prefix_len = len(prefix)
+            pending_thumbnails: list[tuple[str, Path]] = []
             for media in self.media_files:
-                try:
-                    display = media.relative_to(base_for_display)
-                except ValueError:
-                    display = Path(media.name)
+                media_str = str(media)
+                display = media_str[prefix_len:] if media_str.startswith(prefix) else media.name
                 index = len(self._list_paths)
                 iid = f"item-{index}"
                 thumbnail = self._thumbnail_for(media)
-                self.listbox.insert("", tk.END, iid=iid, text=str(display), image=thumbnail)
+                self.listbox.insert("", tk.END, iid=iid, text=display, image=thumbnail)
                 self._list_paths.append(media)
                 self._list_iids.append(iid)
-                if is_image(media):
+                self._list_index[media] = index
+                self._iid_index[iid] = index
+                if media.suffix.lower() in SUPPORTED_IMAGE_EXTS:
+                    self._image_index[media] = len(self.image_files)
                     self.image_files.append(media)
+                    pending_thumbnails.append((iid, media))
+            self._start_thumbnail_job(pending_thumbnails)
 
             if self.image_files:
                 first_image = self.image_files[0]
-                index = self._list_paths.index(first_image)
+                index = self._list_index[first_image]
                 self._select_list_index(index)
                 self._on_listbox_select()
                 video_count = len(self.media_files) - len(self.image_files)
@@ -1372,8 +1606,7 @@ class Application(tk.Tk):
                 self._show_placeholder("Keine Bilder verfügbar.")
             self._update_navigation_state()
         finally:
-            if self._loading_message_var.get() == import_message:
-                self._hide_loading_overlay()
+            self._hide_import_overlay()
 
     # ------------------------------------------------------------------
     # Preview & manual crop
@@ -1392,20 +1625,186 @@ class Application(tk.Tk):
         if is_image(path):
             self._load_preview(path)
         else:
+            self._cancel_preview_load()
             self._show_placeholder("Video ausgewählt – keine Vorschau verfügbar.")
             self._set_controls_enabled(False)
             self.current_path = None
-            self.current_image = None
+            self._set_current_image(None)
         self._update_navigation_state()
 
+    def _open_preview_image(self, path: Path) -> tuple[Image.Image, tuple[int, int]]:
+        """Open ``path`` for the preview and return the image plus its original size.
+
+        JPEGs are decoded via ``draft`` at a reduced scale that still covers the
+        canvas; other formats are downscaled to the same bound after decoding, so
+        the returned image may be smaller than the file itself.
+        """
+
+        preview_size = self.CANVAS_SIZE * 2
+        with _open_image(path) as img:
+            original_size = img.size
+            img.draft("RGB", (preview_size, preview_size))
+            # Decoded pixels outlive the file handle, so RGB sources need no extra copy.
+            img.load()
+            image = img.convert("RGB") if img.mode != "RGB" else img
+        if max(image.size) > preview_size * 2:
+            # Formats without DCT scaling (PNG, HEIC, WebP) arrive at full size.
+            image.thumbnail((preview_size, preview_size), RESAMPLE_BICUBIC)
+        return image, original_size
+
+    def _set_current_image(
+        self, image: Optional[Image.Image], size: tuple[int, int] = (0, 0)
+    ) -> None:
+        """Store the preview image together with the per-image values used by the crop math."""
+
+        self.current_image = image
+        self._current_size = size
+        self._current_max_side = max(1, size[0], size[1])
+
+    def _scale_manual(self, manual: ManualCrop, factor: float) -> ManualCrop:
+        if factor == 1.0:
+            return manual
+        return ManualCrop(
+            start=CropBox(manual.start.x * factor, manual.start.y * factor, manual.start.size * factor),
+            end=CropBox(manual.end.x * factor, manual.end.y * factor, manual.end.size * factor),
+        )
+
     def _load_preview(self, path: Path) -> None:
+        """Decode ``path`` on the loader thread; only the latest request is shown."""
+
+        # Selecting a list row programmatically fires <<TreeviewSelect>> again for the
+        # same file; don't decode it twice.
+        if path == self._loading_path:
+            return
+        if self._loading_path is None and path == self.current_path and self.current_image is not None:
+            return
+        self._preview_request_id += 1
+        self.progress_var.set("Bereit.")
+        cached = self._source_cache.get(path)
+        if cached is not None:
+            self._source_cache.move_to_end(path)
+            self._loading_path = None
+            self._apply_preview(path, *cached)
+            self._prefetch_neighbours(path)
+            return
+        self._loading_path = path
+        self._update_navigation_state()
+        if path in self._prefetching:
+            # The neighbour prefetch is already decoding it; _store_prefetched applies it.
+            return
+        self._submit_preview_load(path)
+
+    def _submit_preview_load(self, path: Path) -> None:
+        request_id = self._preview_request_id
+
+        def job() -> None:
+            # Selections the user has already moved past are never decoded.
+            if request_id != self._preview_request_id:
+                return
+            try:
+                image, size = self._open_preview_image(path)
+            except Exception as exc:  # pragma: no cover - defekte Datei
+                self.after(0, lambda error=exc: self._on_preview_failed(request_id, path, error))
+                return
+            self.after(0, lambda: self._on_preview_ready(request_id, path, image, size))
+
+        self._load_executor.submit(job)
+
+    def _cancel_preview_load(self) -> None:
+        self._preview_request_id += 1
+        self._loading_path = None
+
+    def _on_preview_ready(
+        self, request_id: int, path: Path, image: Image.Image, size: tuple[int, int]
+    ) -> None:
+        if request_id != self._preview_request_id:
+            return
+        self._loading_path = None
+        self._remember_source(path, image, size)
+        self._apply_preview(path, image, size)
+        self._prefetch_neighbours(path)
+
+    def _remember_source(self, path: Path, image: Image.Image, size: tuple[int, int]) -> None:
+        self._source_cache[path] = (image, size)
+        self._source_cache.move_to_end(path)
+        if len(self._source_cache) > self.SOURCE_CACHE_SIZE:
+            self._source_cache.popitem(last=False)
+
+    def _prefetch_neighbours(self, path: Path) -> None:
+        """Decode the previous and next image in the background so stepping is instant."""
+
+        index = self._image_index.get(path)
+        if index is None:
+            return
+        token = self._prefetch_token
+        request_id = self._preview_request_id
+        for neighbour_index in (index + 1, index - 1):
+            if not 0 <= neighbour_index < len(self.image_files):
+                continue
+            neighbour = self.image_files[neighbour_index]
+            if neighbour in self._source_cache or neighbour in self._prefetching:
+                continue
+            self._prefetching.add(neighbour)
+
+            def job(target: Path = neighbour) -> None:
+                if token is not self._prefetch_token:
+                    return
+                if request_id != self._preview_request_id and target != self._loading_path:
+                    # The selection moved on and no longer needs this neighbour.
+                    self.after(0, lambda: self._drop_prefetch(token, target))
+                    return
+                try:
+                    image, size = self._open_preview_image(target)
+                except Exception as exc:  # pragma: no cover - defekte Datei
+                    self.after(0, lambda error=exc: self._on_prefetch_failed(token, target, error))
+                    return
+                self.after(0, lambda: self._store_prefetched(token, target, image, size))
+
+            self._load_executor.submit(job)
+
+    def _store_prefetched(
+        self, token: object, path: Path, image: Image.Image, size: tuple[int, int]
+    ) -> None:
+        if token is not self._prefetch_token:
+            return
+        self._prefetching.discard(path)
+        if path == self._loading_path:
+            self._on_preview_ready(self._preview_request_id, path, image, size)
+        else:
+            self._remember_source(path, image, size)
+
+    def _drop_prefetch(self, token: object, path: Path) -> None:
+        if token is not self._prefetch_token:
+            return
+        self._prefetching.discard(path)
+        if path == self._loading_path:
+            # Selected while the skipped job was deciding; decode it normally.
+            self._submit_preview_load(path)
+
+    def _on_prefetch_failed(self, token: object, path: Path, exc: Exception) -> None:
+        if token is not self._prefetch_token:
+            return
+        self._prefetching.discard(path)
+        if path == self._loading_path:
+            self._on_preview_failed(self._preview_request_id, path, exc)
+
+    def _on_preview_failed(self, request_id: int, path: Path, exc: Exception) -> None:
+        if request_id != self._preview_request_id:
+            return
+        self._loading_path = None
+        self._update_navigation_state()
+        self.progress_var.set(f"Vorschau fehlgeschlagen: {path.name} ({exc})")
+
+    def _apply_preview(self, path: Path, image: Image.Image, size: tuple[int, int]) -> None:
+        if self._pending_render_id is not None:
+            # Slider motion still queued for the previous image must not touch this one.
+            self.after_cancel(self._pending_render_id)
+            self._pending_render_id = None
         self.current_path = path
-        with Image.open(path) as img:
-            self.current_image = img.copy()
+        self._set_current_image(image, size)
         manual = self.manual_crops.get(path)
         if manual is None:
-            assert self.current_image is not None
-            manual = self._default_manual_for_image(self.current_image)
+            manual = self._default_manual_for_size(self._current_size)
             self.manual_crops[path] = manual
             self._auto_generated_paths.discard(path)
         else:
@@ -1415,7 +1814,6 @@ class Application(tk.Tk):
         self._set_controls_enabled(True)
         self._update_navigation_state()
         self._refresh_selected_button_state()
-        self.progress_var.set("Bereit.")
         self._hide_loading_overlay()
 
     def _current_processing_options(self) -> ProcessingOptions:
@@ -1429,7 +1827,7 @@ class Application(tk.Tk):
         base_path = self._normalize_path(base_path)
         output_dir = self._resolve_output_dir()
         if output_dir is None:
-            output_dir = self._default_output_for(base_path)
+            output_dir = _default_output_for(base_path)
         return ProcessingOptions(
             input_path=base_path,
             output_dir=output_dir,
@@ -1440,30 +1838,33 @@ class Application(tk.Tk):
             motion_direction=self.motion_direction_var.get(),
         )
 
-    def _normalize_manual_for_image(
+    def _normalize_manual_for_size(
         self,
-        image: Image.Image,
+        size: tuple[int, int],
         manual: ManualCrop,
         overflow: Optional[float] = None,
     ) -> ManualCrop:
-        width, height = image.size
+        width, height = size
         start = self._normalize_crop_box(manual.start, width, height, overflow=overflow)
         end = self._normalize_crop_box(manual.end, width, height, overflow=overflow)
         return ManualCrop(start=start, end=end)
 
-    def _default_manual_for_image(self, image: Image.Image) -> ManualCrop:
-        width, height = image.size
-        size = float(min(width, height))
-        base = CropBox((width - size) / 2, (height - size) / 2, size)
+    def _default_manual_for_size(self, size: tuple[int, int]) -> ManualCrop:
+        width, height = size
+        side = float(min(width, height))
+        base = CropBox((width - side) / 2, (height - side) / 2, side)
         manual = ManualCrop(start=base, end=base)
-        return self._normalize_manual_for_image(image, manual, overflow=0.0)
+        return self._normalize_manual_for_size(size, manual, overflow=0.0)
 
     def _compute_auto_manual_for_image(
         self,
         image: Image.Image,
         options: ProcessingOptions,
         cropper: Optional[FaceCropper],
+        original_size: Optional[tuple[int, int]] = None,
     ) -> ManualCrop:
+        from .image_pipeline import determine_crop_box, determine_motion_manual
+
         if options.motion_enabled and cropper is not None:
             manual = determine_motion_manual(image, options, cropper)
         elif cropper is not None:
@@ -1474,13 +1875,28 @@ class Application(tk.Tk):
             size = float(min(width, height))
             base = CropBox((width - size) / 2, (height - size) / 2, size)
             manual = ManualCrop(start=base, end=base)
-        return self._normalize_manual_for_image(image, manual, overflow=0.0)
+        if original_size is None:
+            original_size = image.size
+        elif original_size != image.size:
+            manual = self._scale_manual(manual, original_size[0] / max(1, image.width))
+        return self._normalize_manual_for_size(original_size, manual, overflow=0.0)
 
     def _start_auto_detection(self, path: Path, *, message: str) -> None:
         if self.current_image is None:
             return
-        image = self.current_image.copy()
+        cache_key = (path, self.motion_enabled_var.get(), self.motion_direction_var.get())
+        cached = self._auto_manual_cache.get(cache_key)
+        if cached is not None:
+            # Same image and settings as a previous run: skip the detector and the
+            # ProcessingOptions/output path setup entirely.
+            self._auto_task_token = None
+            if path == self.current_path:
+                self._apply_auto_manual(path, cached)
+            return
         options = self._current_processing_options()
+        # The preview image is never modified in place, so the worker can share it.
+        image = self.current_image
+        original_size = self._current_size
         cropper = self._get_preview_cropper()
         token = object()
         self._auto_task_token = token
@@ -1490,17 +1906,23 @@ class Application(tk.Tk):
 
         def worker() -> None:
             try:
-                manual = self._compute_auto_manual_for_image(image, options, cropper)
+                manual = self._compute_auto_manual_for_image(
+                    image, options, cropper, original_size
+                )
             except Exception as exc:
                 result: ManualCrop | Exception = exc
             else:
                 result = manual
-            self.after(0, lambda: self._finish_auto_detection(token, path, result))
+            self.after(0, lambda: self._finish_auto_detection(token, path, result, cache_key))
 
         threading.Thread(target=worker, daemon=True).start()
 
     def _finish_auto_detection(
-        self, token: object, path: Path, result: ManualCrop | Exception
+        self,
+        token: object,
+        path: Path,
+        result: ManualCrop | Exception,
+        cache_key: Optional[tuple[Path, bool, str]] = None,
     ) -> None:
         if token != self._auto_task_token:
             return
@@ -1522,6 +1944,11 @@ class Application(tk.Tk):
             self._refresh_selected_button_state()
             self._update_navigation_state()
             return
+        if cache_key is not None:
+            self._auto_manual_cache[cache_key] = result
+        self._apply_auto_manual(path, result)
+
+    def _apply_auto_manual(self, path: Path, result: ManualCrop) -> None:
         manual = self._normalize_manual(result)
         self.manual_crops[path] = manual
         self._auto_generated_paths.add(path)
@@ -1536,7 +1963,9 @@ class Application(tk.Tk):
         assert self.current_image is not None
         options = self._current_processing_options()
         cropper = self._get_preview_cropper()
-        return self._compute_auto_manual_for_image(self.current_image, options, cropper)
+        return self._compute_auto_manual_for_image(
+            self.current_image, options, cropper, self._current_size
+        )
 
     # ------------------------------------------------------------------
     # Memory-Minispiel für die Wartezeit
@@ -1602,11 +2031,12 @@ class Application(tk.Tk):
         border_color = "#2b3f66"
         max_content = max(1, size - 12)
         try:
-            with Image.open(path) as img:
+            with _open_image(path) as img:
+                img.draft("RGB", (max_content, max_content))
                 picture = img.convert("RGB")
         except Exception:
             picture = Image.new("RGB", (max_content, max_content), "#24335a")
-        picture.thumbnail((max_content, max_content), RESAMPLE_LANCZOS)
+        picture.thumbnail((max_content, max_content), RESAMPLE_BICUBIC)
         offset = ((size - picture.width) // 2, (size - picture.height) // 2)
         canvas.paste(picture, offset)
         draw = ImageDraw.Draw(canvas)
@@ -1906,26 +2336,28 @@ class Application(tk.Tk):
         def worker() -> None:
             results: dict[Path, ManualCrop] = {}
             errors: dict[Path, Exception] = {}
+            last_post = 0.0
             for index, path in enumerate(images, start=1):
                 try:
-                    with Image.open(path) as img:
-                        image = img.copy()
+                    # Detection runs on the preview-sized decode; crops are scaled back.
+                    image, original_size = self._open_preview_image(path)
                 except Exception as exc:
                     errors[path] = exc
                 else:
                     try:
-                        manual = self._compute_auto_manual_for_image(image, options, cropper)
+                        manual = self._compute_auto_manual_for_image(
+                            image, options, cropper, original_size
+                        )
                     except Exception as exc:  # pragma: no cover - GUI feedback
                         errors[path] = exc
                     else:
                         results[path] = manual
                 finally:
-                    self.after(
-                        0,
-                        lambda idx=index, total=total: self._update_bulk_auto_progress(
-                            token, idx, total
-                        ),
-                    )
+                    # Same cadence as the batch progress; unreadable files finish fast.
+                    now = time.monotonic()
+                    if index == total or now - last_post >= self.PROGRESS_INTERVAL:
+                        last_post = now
+                        self.after(0, self._update_bulk_auto_progress, token, index, total)
             self.after(
                 0,
                 lambda: self._finish_bulk_auto(token, results, errors, total),
@@ -2029,44 +2461,52 @@ class Application(tk.Tk):
 
     def _normalize_manual(self, manual: ManualCrop, overflow: Optional[float] = None) -> ManualCrop:
         assert self.current_image is not None
-        return self._normalize_manual_for_image(self.current_image, manual, overflow=overflow)
+        return self._normalize_manual_for_size(self._current_size, manual, overflow=overflow)
 
     def _active_manual_crop(self, manual: ManualCrop) -> CropBox:
-        if self.motion_enabled_var.get() and self.active_crop_var.get() == "start":
+        if self._motion_enabled and self._active_crop == "start":
             return manual.start
         return manual.end
 
-    def _sync_sliders_with_active(self, manual: ManualCrop) -> None:
+    def _slider_ranges(self, size: float) -> tuple[float, float, float, float]:
+        """Return ``(min_x, range_x, min_y, range_y)`` for a crop of ``size`` on the current image."""
+
+        width, height = self._current_size
+        overflow = self.PREVIEW_OVERFLOW_RATIO
+        min_x, max_x = crop_position_bounds(size, width, overflow_ratio=overflow, axis="x")
+        min_y, max_y = crop_position_bounds(size, height, overflow_ratio=overflow, axis="y")
+        return min_x, max_x - min_x, min_y, max_y - min_y
+
+    def _sync_sliders_with_active(
+        self, manual: ManualCrop, current: Optional[tuple[float, float, float]] = None
+    ) -> None:
+        """Move the sliders to ``manual``'s active crop.
+
+        ``current`` holds the values the sliders showed when ``manual`` was derived
+        from them; sliders that would not move are left alone, which spares the
+        Tcl round trip and widget redraw on every slider tick.
+        """
+
         if self.current_image is None:
             return
         crop = self._active_manual_crop(manual)
-        width, height = self.current_image.size
-        max_side = max(1, max(width, height))
-        size_ratio = clamp(crop.size / max_side, 0.01, 1.0)
-        min_x, max_x = crop_position_bounds(
-            crop.size,
-            width,
-            overflow_ratio=self.PREVIEW_OVERFLOW_RATIO,
-            axis="x",
+        size_ratio = min(max(crop.size / self._current_max_side, 0.01), 1.0)
+        min_x, range_x, min_y, range_y = self._slider_ranges(crop.size)
+        offset_x = min(max((crop.x - min_x) / range_x, 0.0), 1.0) if range_x else 0.0
+        offset_y = min(max((crop.y - min_y) / range_y, 0.0), 1.0) if range_y else 0.0
+        targets = (
+            (self.size_ratio, size_ratio),
+            (self.offset_x, offset_x),
+            (self.offset_y, offset_y),
         )
-        min_y, max_y = crop_position_bounds(
-            crop.size,
-            height,
-            overflow_ratio=self.PREVIEW_OVERFLOW_RATIO,
-            axis="y",
-        )
-        range_x = max_x - min_x
-        range_y = max_y - min_y
-        offset_x = clamp((crop.x - min_x) / range_x if range_x else 0.0, 0.0, 1.0)
-        offset_y = clamp((crop.y - min_y) / range_y if range_y else 0.0, 0.0, 1.0)
         self._updating_controls = True
-        self.size_ratio.set(size_ratio)
-        self.offset_x.set(offset_x)
-        self.offset_y.set(offset_y)
+        for index, (variable, value) in enumerate(targets):
+            if current is None or abs(current[index] - value) > 1e-9:
+                variable.set(value)
         self._updating_controls = False
 
     def _update_crop_info(self, manual: ManualCrop) -> None:
-        if self.motion_enabled_var.get():
+        if self._motion_enabled:
             start = manual.start
             end = manual.end
             self.crop_info_var.set(
@@ -2089,6 +2529,7 @@ class Application(tk.Tk):
         *,
         sync_controls: bool = True,
         auto_generated: Optional[bool] = None,
+        slider_values: Optional[tuple[float, float, float]] = None,
     ) -> None:
         if self.current_image is None or self.current_path is None:
             return
@@ -2099,7 +2540,7 @@ class Application(tk.Tk):
         elif auto_generated is False:
             self._auto_generated_paths.discard(self.current_path)
         if sync_controls:
-            self._sync_sliders_with_active(normalized)
+            self._sync_sliders_with_active(normalized, slider_values)
         self._render_preview(normalized)
         self._update_position_label()
 
@@ -2138,7 +2579,13 @@ class Application(tk.Tk):
         self._refresh_crop_buttons()
         self._refresh_legend_state()
 
+    def _sync_crop_vars(self, *_args: object) -> None:
+        self._motion_enabled = self.motion_enabled_var.get()
+        self._active_crop = self.active_crop_var.get()
+
     def _on_active_crop_change(self, *_args: object) -> None:
+        # Tk runs the most recently added trace first, so refresh the mirrors here.
+        self._sync_crop_vars()
         if not self.motion_enabled_var.get():
             if self.active_crop_var.get() != "end":
                 self.active_crop_var.set("end")
@@ -2177,312 +2624,425 @@ class Application(tk.Tk):
                 self._refresh_legend_state()
 
     def _on_slider_change(self, _value: float | str) -> None:
+        """Throttle slider motion to one crop update per ``SLIDER_RENDER_DELAY_MS``."""
+
+        if self._updating_controls or self._pending_render_id is not None:
+            return
+        self._pending_render_id = self.after(self.SLIDER_RENDER_DELAY_MS, self._flush_slider_change)
+
+    def _schedule_slider_apply(self) -> None:
+        """Apply button-driven value changes once the event queue is idle.
+
+        Rapid clicks only move the Tk variables; a single pending callback then
+        renders the latest values. A throttled slider update already in flight
+        picks them up as well.
+        """
+
+        if self._pending_render_id is None:
+            self._pending_render_id = self.after_idle(self._flush_slider_change)
+
+    def _flush_slider_change(self) -> None:
+        self._pending_render_id = None
+        self._apply_slider_values()
+
+    def _apply_slider_values(self) -> None:
         if self._updating_controls or self.current_image is None or self.current_path is None:
             return
-        width, height = self.current_image.size
-        max_side = max(1, max(width, height))
-        ratio = clamp(self.size_ratio.get(), 0.01, 1.0)
-        size = ratio * max_side
-        min_x, max_x = crop_position_bounds(
-            size,
-            width,
-            overflow_ratio=self.PREVIEW_OVERFLOW_RATIO,
-            axis="x",
-        )
-        min_y, max_y = crop_position_bounds(
-            size,
-            height,
-            overflow_ratio=self.PREVIEW_OVERFLOW_RATIO,
-            axis="y",
-        )
-        norm_x = clamp(self.offset_x.get(), 0.0, 1.0)
-        norm_y = clamp(self.offset_y.get(), 0.0, 1.0)
-        range_x = max_x - min_x
-        range_y = max_y - min_y
-        x = min_x + norm_x * range_x if range_x else min_x
-        y = min_y + norm_y * range_y if range_y else min_y
-        new_crop = self._normalize_crop_box(CropBox(x=x, y=y, size=size), width, height, overflow=0.0)
         manual = self.manual_crops.get(self.current_path)
         if manual is None:
             return
-        start = CropBox(manual.start.x, manual.start.y, manual.start.size)
-        end = CropBox(manual.end.x, manual.end.y, manual.end.size)
-        if self.motion_enabled_var.get():
-            if self.active_crop_var.get() == "start":
-                start = new_crop
-            else:
-                end = new_crop
-        else:
+        width, height = self._current_size
+        slider_values = (self.size_ratio.get(), self.offset_x.get(), self.offset_y.get())
+        size = min(max(slider_values[0], 0.01), 1.0) * self._current_max_side
+        norm_x = min(max(slider_values[1], 0.0), 1.0)
+        norm_y = min(max(slider_values[2], 0.0), 1.0)
+        min_x, range_x, min_y, range_y = self._slider_ranges(size)
+        x = min_x + norm_x * range_x
+        y = min_y + norm_y * range_y
+        new_crop = self._normalize_crop_box(CropBox(x=x, y=y, size=size), width, height, overflow=0.0)
+        start = manual.start
+        end = manual.end
+        if not self._motion_enabled:
+            start = end = new_crop
+        elif self._active_crop == "start":
             start = new_crop
+        else:
             end = new_crop
         self._update_current_manual(
             ManualCrop(start=start, end=end),
             sync_controls=True,
             auto_generated=False,
+            slider_values=slider_values,
         )
 
     def _canvas_rect(self, crop: CropBox) -> tuple[float, float, float, float]:
         offset_x, offset_y = self._canvas_offset
         scale = self._canvas_scale
-        return (
-            offset_x + crop.x * scale,
-            offset_y + crop.y * scale,
-            offset_x + (crop.x + crop.size) * scale,
-            offset_y + (crop.y + crop.size) * scale,
-        )
+        x1 = offset_x + crop.x * scale
+        y1 = offset_y + crop.y * scale
+        side = crop.size * scale
+        return (x1, y1, x1 + side, y1 + side)
 
     def _detect_handle(self, rect: tuple[float, float, float, float], x: float, y: float) -> Optional[str]:
         handle_range = 10.0
         x1, y1, x2, y2 = rect
-        corners = {
-            "nw": (x1, y1),
-            "ne": (x2, y1),
-            "sw": (x1, y2),
-            "se": (x2, y2),
-        }
-        for name, (cx, cy) in corners.items():
-            if abs(x - cx) <= handle_range and abs(y - cy) <= handle_range:
-                return name
-        return None
+        west = abs(x - x1) <= handle_range
+        east = abs(x - x2) <= handle_range
+        north = abs(y - y1) <= handle_range
+        south = abs(y - y2) <= handle_range
+        if not ((west or east) and (north or south)):
+            return None
+        return ("n" if north else "s") + ("w" if west else "e")
+
+    def _create_canvas_items(self) -> None:
+        """Allocate the preview image, crop overlays and navigation shapes once.
+
+        Rendering only moves and recolours these items; they are hidden instead
+        of deleted when no preview is shown.
+        """
+
+        canvas = self.canvas
+        center = self.CANVAS_SIZE / 2
+        self._canvas_image_id = canvas.create_image(center, center, state="hidden")
+        outlines: dict[str, tuple[int, int]] = {}
+        for target in ("start", "end"):
+            color = self._legend_colors.get(target, "#ffffff")
+            rect_id = canvas.create_rectangle(0, 0, 0, 0, outline=color, state="hidden", tags=("overlay",))
+            oval_id = canvas.create_oval(0, 0, 0, 0, outline=color, state="hidden", tags=("overlay",))
+            outlines[target] = (rect_id, oval_id)
+        for target, text in (("start", "1"), ("end", "2")):
+            tag = f"label_{target}"
+            label_id = canvas.create_text(
+                0,
+                0,
+                text=text,
+                fill=self._legend_colors.get(target, "#ffffff"),
+                font=("Segoe UI", 16, "bold"),
+                state="hidden",
+                tags=("overlay", "crop_label", tag),
+            )
+            canvas.tag_bind(tag, "<Button-1>", lambda _e, t=target: self._select_crop(t))
+            self._crop_item_ids[target] = (*outlines[target], label_id)
+        self._handle_ids = [
+            canvas.create_rectangle(0, 0, 0, 0, state="hidden", tags=("overlay", "handle"))
+            for _ in range(4)
+        ]
+        canvas.tag_bind("crop_label", "<Enter>", lambda _e: canvas.config(cursor="hand2"))
+        canvas.tag_bind("crop_label", "<Leave>", lambda _e: canvas.config(cursor=""))
 
-    def _draw_handles(self, rect: tuple[float, float, float, float], color: str) -> None:
-        handle = 6
-        x1, y1, x2, y2 = rect
-        for x, y in ((x1, y1), (x2, y1), (x1, y2), (x2, y2)):
-            self.canvas.create_rectangle(
-                x - handle,
-                y - handle,
-                x + handle,
-                y + handle,
-                outline=color,
-                fill=color,
-                tags=("handle",),
+        radius = 18
+        center_y = self.CANVAS_SIZE / 2
+        for tag, center_x, direction in (
+            ("nav_prev", radius + 6, -1),
+            ("nav_next", self.CANVAS_SIZE - radius - 6, 1),
+        ):
+            tags = ("nav", tag)
+            oval_id = canvas.create_oval(
+                center_x - radius,
+                center_y - radius,
+                center_x + radius,
+                center_y + radius,
+                outline="",
+                state="hidden",
+                tags=tags,
             )
+            arrow_id = canvas.create_polygon(
+                center_x - 6 * direction,
+                center_y - 10,
+                center_x + 6 * direction,
+                center_y,
+                center_x - 6 * direction,
+                center_y + 10,
+                outline="",
+                state="hidden",
+                tags=tags,
+            )
+            self._nav_item_ids[tag] = (oval_id, arrow_id)
+        canvas.tag_bind("nav_prev", "<Button-1>", self._on_nav_prev)
+        canvas.tag_bind("nav_next", "<Button-1>", self._on_nav_next)
 
-    def _draw_orientation_circle(
-        self, rect: tuple[float, float, float, float], color: str, line_width: int
-    ) -> None:
+    def _hide_canvas_items(self) -> None:
+        self.canvas.itemconfigure("all", state="hidden")
+        self._nav_item_state = None
+        self._start_items_visible = False
+        self._image_item_visible = False
+
+    def _place_handles(self, rect: tuple[float, float, float, float], color: str) -> None:
+        handle = 6
+        x1, y1, x2, y2 = rect
+        coords = self.canvas.coords
+        for item_id, (x, y) in zip(self._handle_ids, ((x1, y1), (x2, y1), (x1, y2), (x2, y2))):
+            coords(item_id, x - handle, y - handle, x + handle, y + handle)
+        self.canvas.itemconfigure("handle", outline=color, fill=color, state="normal")
+
+    def _orientation_circle_coords(
+        self, rect: tuple[float, float, float, float]
+    ) -> Optional[tuple[float, float, float, float]]:
         x1, y1, x2, y2 = rect
         diameter = min(x2 - x1, y2 - y1)
         if diameter <= 0:
-            return
+            return None
         margin = diameter * self.CIRCLE_MARGIN
         top = y1
         bottom = y2 - 2 * margin
         if bottom <= top:
             top = y1 + margin
             bottom = y2 - margin
-        self.canvas.create_oval(
-            x1 + margin,
-            top,
-            x2 - margin,
-            bottom,
-            outline=color,
-            width=line_width,
-        )
+        return (x1 + margin, top, x2 - margin, bottom)
+
+    def _place_crop_items(
+        self, target: str, rect: tuple[float, float, float, float], line_width: int
+    ) -> None:
+        canvas = self.canvas
+        rect_id, oval_id, label_id = self._crop_item_ids[target]
+        canvas.coords(rect_id, *rect)
+        canvas.itemconfigure(rect_id, width=line_width, state="normal")
+        circle = self._orientation_circle_coords(rect)
+        if circle is None:
+            canvas.itemconfigure(oval_id, state="hidden")
+        else:
+            canvas.coords(oval_id, *circle)
+            canvas.itemconfigure(oval_id, width=line_width, state="normal")
+        canvas.coords(label_id, (rect[0] + rect[2]) / 2, (rect[1] + rect[3]) / 2)
+        canvas.itemconfigure(label_id, state="normal")
+
+    def _render_single_crop(self, crop: CropBox) -> None:
+        """Draw the lone end crop used when motion is disabled."""
+
+        if self._start_items_visible:
+            for item_id in self._crop_item_ids["start"]:
+                self.canvas.itemconfigure(item_id, state="hidden")
+            self._start_items_visible = False
+        end_color = self._legend_colors.get("end", self._end_color)
+        end_rect = self._canvas_rect(crop)
+        self._manual_display["end"] = end_rect
+        self._place_crop_items("end", end_rect, 3)
+        self._place_handles(end_rect, end_color)
+
+    def _render_dual_crops(self, start: CropBox, end: CropBox, start_active: bool) -> None:
+        start_rect = self._canvas_rect(start)
+        end_rect = self._canvas_rect(end)
+        self._manual_display["start"] = start_rect
+        self._manual_display["end"] = end_rect
+        self._place_crop_items("start", start_rect, 3 if start_active else 2)
+        self._place_crop_items("end", end_rect, 2 if start_active else 3)
+        self._start_items_visible = True
+        if start_active:
+            self._place_handles(start_rect, self._legend_colors.get("start", self._start_color))
+        else:
+            self._place_handles(end_rect, self._legend_colors.get("end", self._end_color))
 
     def _render_preview(self, manual: ManualCrop) -> None:
         if self.current_image is None:
             return
-        width, height = self.current_image.size
+        displayed = self._displayed_frame_key
+        # Slider and drag updates leave the bitmap untouched; only the overlays move.
+        if not (
+            self._image_item_visible
+            and displayed is not None
+            and displayed[0] == self.current_path
+        ):
+            self._render_image()
+        self._render_overlays(manual)
+
+    def _render_image(self) -> None:
+        """Show the preview bitmap for the current image, reusing the cached frame when possible."""
+
+        assert self.current_image is not None
+        width, height = self._current_size
         scale = min(self.CANVAS_SIZE / width, self.CANVAS_SIZE / height, 1.0)
         display_width = int(width * scale)
         display_height = int(height * scale)
-        resized = self.current_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-        self._tk_image = ImageTk.PhotoImage(resized)
-
-        self.canvas.delete("all")
+        self._canvas_scale = scale
+        self._canvas_offset = (
+            (self.CANVAS_SIZE - display_width) / 2,
+            (self.CANVAS_SIZE - display_height) / 2,
+        )
+        self._ensure_preview_buffers()
+        self._tk_image = self._front_image
+        # The buffer swaps keep the item's image current; only unhide it after a reset.
+        if not self._image_item_visible:
+            self.canvas.itemconfigure(self._canvas_image_id, image=self._tk_image, state="normal")
+            self._image_item_visible = True
+        key = (self.current_path, display_width, display_height)
+        if key != self._displayed_frame_key and key != self._pending_frame_key:
+            self._request_preview_frame(key, self.current_image, (display_width, display_height))
+
+    def _render_overlays(self, manual: ManualCrop) -> None:
         self.canvas.config(cursor="")
-        offset_x = (self.CANVAS_SIZE - display_width) / 2
-        offset_y = (self.CANVAS_SIZE - display_height) / 2
-        self.canvas.create_image(self.CANVAS_SIZE / 2, self.CANVAS_SIZE / 2, image=self._tk_image)
+        self._render_crop_items(manual)
+        self._update_crop_info(manual)
+        has_prev, has_next = self._navigation_flags()
+        self._update_canvas_navigation(has_prev, has_next)
+        # Buttons and legend only depend on these flags; restyling a dozen widgets on
+        # every slider tick is wasted work.
+        ui_state = (self._crop_buttons_enabled, self._motion_enabled, self._active_crop)
+        if ui_state != self._overlay_ui_state:
+            self._overlay_ui_state = ui_state
+            self._refresh_crop_buttons()
+            self._refresh_legend_state()
 
-        self._canvas_scale = scale
-        self._canvas_offset = (offset_x, offset_y)
+    def _render_crop_items(self, manual: ManualCrop) -> None:
         self._manual_display = {}
-
-        active_target = "start" if self.motion_enabled_var.get() and self.active_crop_var.get() == "start" else "end"
-
-        def draw_label(rect: tuple[float, float, float, float], target: str, text: str) -> None:
-            cx = (rect[0] + rect[2]) / 2
-            cy = (rect[1] + rect[3]) / 2
-            tag = f"label_{target}"
-            self.canvas.create_text(
-                cx,
-                cy,
-                text=text,
-                fill=self._legend_colors.get(target, "#ffffff"),
-                font=("Segoe UI", 16, "bold"),
-                tags=("crop_label", tag),
-            )
-            self.canvas.tag_bind(tag, "<Button-1>", lambda _e, t=target: self._select_crop(t))
-
-        start_color = self._legend_colors.get("start", self._start_color)
-        end_color = self._legend_colors.get("end", self._end_color)
-
-        if self.motion_enabled_var.get():
-            start_rect = self._canvas_rect(manual.start)
-            end_rect = self._canvas_rect(manual.end)
-            self._manual_display["start"] = start_rect
-            self._manual_display["end"] = end_rect
-            start_active = active_target == "start"
-            end_active = active_target == "end"
-            self.canvas.create_rectangle(
-                *start_rect,
-                outline=start_color,
-                width=3 if start_active else 2,
-            )
-            self._draw_orientation_circle(start_rect, start_color, 3 if start_active else 2)
-            self.canvas.create_rectangle(
-                *end_rect,
-                outline=end_color,
-                width=3 if end_active else 2,
-            )
-            self._draw_orientation_circle(end_rect, end_color, 3 if end_active else 2)
-            draw_label(start_rect, "start", "1")
-            draw_label(end_rect, "end", "2")
-            if start_active:
-                self._draw_handles(start_rect, start_color)
-            else:
-                self._draw_handles(end_rect, end_color)
+        if self._motion_enabled:
+            start_active = self._active_crop == "start"
+            self._render_dual_crops(manual.start, manual.end, start_active)
+        else:
+            self._render_single_crop(manual.end)
+
+    def _ensure_preview_buffers(self) -> None:
+        if self._front_image is None or self._back_image is None:
+            size = (self.CANVAS_SIZE, self.CANVAS_SIZE)
+            self._front_image = ImageTk.PhotoImage("RGB", size)
+            self._back_image = ImageTk.PhotoImage("RGB", size)
+
+    def _compose_preview_frame(
+        self, image: Image.Image, display_size: tuple[int, int], *, rough: bool = False
+    ) -> Image.Image:
+        if rough:
+            # Box-reduce by an integer factor, then a bilinear fit: a few milliseconds
+            # even for large sources, good enough until the real frame arrives.
+            step = max(1, min(image.width // display_size[0], image.height // display_size[1]))
+            reduced = image.reduce(step) if step > 1 else image
+            resized = reduced.resize(display_size, RESAMPLE_BILINEAR)
         else:
-            end_rect = self._canvas_rect(manual.end)
-            self._manual_display["end"] = end_rect
-            self.canvas.create_rectangle(*end_rect, outline=end_color, width=3)
-            self._draw_orientation_circle(end_rect, end_color, 3)
-            self._draw_handles(end_rect, end_color)
-            draw_label(end_rect, "end", "2")
+            resized = image.resize(display_size, self.PREVIEW_RESAMPLE, reducing_gap=3.0)
+        frame = Image.new("RGB", (self.CANVAS_SIZE, self.CANVAS_SIZE), self.CANVAS_BACKGROUND)
+        offset = (
+            (self.CANVAS_SIZE - display_size[0]) // 2,
+            (self.CANVAS_SIZE - display_size[1]) // 2,
+        )
+        frame.paste(resized, offset)
+        return frame
 
-        self.canvas.tag_bind("crop_label", "<Enter>", lambda _e: self.canvas.config(cursor="hand2"))
-        self.canvas.tag_bind("crop_label", "<Leave>", lambda _e: self.canvas.config(cursor=""))
+    def _request_preview_frame(
+        self, key: PreviewKey, image: Image.Image, display_size: tuple[int, int]
+    ) -> None:
+        """Compose the preview bitmap on the render worker; only the newest request is kept."""
 
-        self._update_crop_info(manual)
-        has_prev, has_next = self._navigation_flags()
-        self._update_canvas_navigation(has_prev, has_next)
-        self._refresh_crop_buttons()
-        self._refresh_legend_state()
+        token = object()
+        self._render_token = token
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            self._preview_cache.move_to_end(key)
+            self._swap_preview_buffers(token, key, cached)
+            return
+        self._pending_frame_key = key
+        # A new image gets a rough frame first; size changes of the same image don't need one.
+        show_rough = self._displayed_frame_key is None or self._displayed_frame_key[0] != key[0]
+
+        def job() -> None:
+            if token is not self._render_token:
+                return
+            if show_rough:
+                rough = self._compose_preview_frame(image, display_size, rough=True)
+                self.after(0, lambda: self._show_rough_frame(token, rough))
+            frame = self._compose_preview_frame(image, display_size)
+            self.after(0, lambda: self._swap_preview_buffers(token, key, frame))
+
+        self._render_executor.submit(job)
+
+    def _show_rough_frame(self, token: object, frame: Image.Image) -> None:
+        if token is not self._render_token or self._back_image is None:
+            return
+        self._back_image.paste(frame)
+        self.canvas.itemconfigure(self._canvas_image_id, image=self._back_image)
+        self._front_image, self._back_image = self._back_image, self._front_image
+        self._tk_image = self._front_image
+        self._displayed_frame_key = None
+
+    def _swap_preview_buffers(self, token: object, key: PreviewKey, frame: Image.Image) -> None:
+        if token is not self._render_token or self._back_image is None:
+            return
+        self._render_token = None
+        self._pending_frame_key = None
+        self._preview_cache[key] = frame
+        # Frames are keyed by path, so switching back to a recent image skips the resize.
+        if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        self._back_image.paste(frame)
+        self.canvas.itemconfigure(self._canvas_image_id, image=self._back_image)
+        self._front_image, self._back_image = self._back_image, self._front_image
+        self._tk_image = self._front_image
+        self._displayed_frame_key = key
 
     def _show_placeholder(self, message: str) -> None:
-        self.canvas.delete("all")
+        self._hide_canvas_items()
         self._tk_image = None
+        self._render_token = None
+        self._pending_frame_key = None
         self._manual_display = {}
         self.crop_info_var.set(message)
 
+    def _current_image_index(self) -> Optional[int]:
+        # While a preview is still decoding, navigate relative to the requested image.
+        path = self._loading_path if self._loading_path is not None else self.current_path
+        if path is None:
+            return None
+        return self._image_index.get(path)
+
     def _navigation_flags(self) -> tuple[bool, bool]:
-        if not self.image_files or self.current_path not in self.image_files:
+        index = self._current_image_index()
+        if index is None:
             return False, False
-        index = self.image_files.index(self.current_path)
         has_prev = index > 0
         has_next = index < len(self.image_files) - 1
         return has_prev, has_next
 
     def _update_canvas_navigation(self, has_prev: bool, has_next: bool) -> None:
-        self.canvas.delete("nav")
-        self.canvas.tag_unbind("nav_prev", "<Button-1>")
-        self.canvas.tag_unbind("nav_next", "<Button-1>")
+        self._nav_prev_enabled = has_prev and self._tk_image is not None
+        self._nav_next_enabled = has_next and self._tk_image is not None
+        nav_state = (self._tk_image is not None, has_prev, has_next)
+        # Called on every overlay render; the arrows only change at the list ends.
+        if nav_state == self._nav_item_state:
+            return
+        self._nav_item_state = nav_state
         if self._tk_image is None:
+            self.canvas.itemconfigure("nav", state="hidden")
             return
 
-        radius = 18
-        center_y = self.CANVAS_SIZE / 2
-        left_center = radius + 6
-        right_center = self.CANVAS_SIZE - radius - 6
-
-        def draw_arrow(center_x: float, enabled: bool, tag: str) -> None:
+        for tag, enabled in (("nav_prev", has_prev), ("nav_next", has_next)):
+            oval_id, arrow_id = self._nav_item_ids[tag]
             background = "#1f6feb" if enabled else "#101321"
             foreground = "#ffffff" if enabled else "#2f3548"
-            tags = ("nav", tag)
-            self.canvas.create_oval(
-                center_x - radius,
-                center_y - radius,
-                center_x + radius,
-                center_y + radius,
-                fill=background,
-                outline="",
-                tags=tags,
-            )
-            if tag == "nav_prev":
-                points = [
-                    center_x + 6,
-                    center_y - 10,
-                    center_x - 6,
-                    center_y,
-                    center_x + 6,
-                    center_y + 10,
-                ]
-            else:
-                points = [
-                    center_x - 6,
-                    center_y - 10,
-                    center_x + 6,
-                    center_y,
-                    center_x - 6,
-                    center_y + 10,
-                ]
-            self.canvas.create_polygon(points, fill=foreground, outline="", tags=tags)
-            if enabled:
-                if tag == "nav_prev":
-                    self.canvas.tag_bind("nav_prev", "<Button-1>", lambda _e: self._show_previous_image())
-                else:
-                    self.canvas.tag_bind("nav_next", "<Button-1>", lambda _e: self._show_next_image())
+            self.canvas.itemconfigure(oval_id, fill=background, state="normal")
+            self.canvas.itemconfigure(arrow_id, fill=foreground, state="normal")
 
-        draw_arrow(left_center, has_prev, "nav_prev")
-        draw_arrow(right_center, has_next, "nav_next")
+    def _on_nav_prev(self, _event: tk.Event) -> None:
+        if self._nav_prev_enabled:
+            self._show_previous_image()
+
+    def _on_nav_next(self, _event: tk.Event) -> None:
+        if self._nav_next_enabled:
+            self._show_next_image()
 
     def _resize_crop_with_handle(
         self, crop: CropBox, handle: str, dx: float, dy: float, width: int, height: int
     ) -> CropBox:
-        x1 = crop.x
-        y1 = crop.y
-        x2 = crop.x + crop.size
-        y2 = crop.y + crop.size
-        if handle == "se":
-            new_x2 = x2 + dx
-            new_y2 = y2 + dy
-            size = max(1.0, max(new_x2 - x1, new_y2 - y1))
-            x = x1
-            y = y1
-        elif handle == "sw":
-            new_x1 = x1 + dx
-            new_y2 = y2 + dy
-            size = max(1.0, max(x2 - new_x1, new_y2 - y1))
-            x = x2 - size
-            y = y1
-        elif handle == "ne":
-            new_x2 = x2 + dx
-            new_y1 = y1 + dy
-            size = max(1.0, max(new_x2 - x1, y2 - new_y1))
-            x = x1
-            y = y2 - size
-        else:  # "nw"
-            new_x1 = x1 + dx
-            new_y1 = y1 + dy
-            size = max(1.0, max(x2 - new_x1, y2 - new_y1))
-            x = x2 - size
-            y = y2 - size
-        resized = CropBox(x=x, y=y, size=size)
-        return self._normalize_crop_box(resized, width, height)
+        sign_x, sign_y = _HANDLE_SIGNS.get(handle, (-1.0, -1.0))
+        size = max(1.0, crop.size + sign_x * dx, crop.size + sign_y * dy)
+        # The corner opposite the dragged handle stays anchored.
+        x = crop.x if sign_x > 0 else crop.x + crop.size - size
+        y = crop.y if sign_y > 0 else crop.y + crop.size - size
+        return self._normalize_crop_box(CropBox(x=x, y=y, size=size), width, height)
 
     def _on_canvas_press(self, event: tk.Event) -> None:
-        tags = self.canvas.gettags("current")
-        if "nav_prev" in tags:
-            self._show_previous_image()
-            return
-        if "nav_next" in tags:
-            self._show_next_image()
+        if "nav" in self.canvas.gettags("current"):
+            # Navigation arrows handle their clicks through tag bindings.
             return
         if self.current_path is None or self.current_path not in self.manual_crops or self.current_image is None:
             return
         manual = self.manual_crops[self.current_path]
+        active = self._active_crop
         candidates = []
-        if self.motion_enabled_var.get():
+        if self._motion_enabled:
             candidates.extend(["start", "end"])
         else:
             candidates.append("end")
         # Prefer the currently active crop if available
-        if self.motion_enabled_var.get() and self.active_crop_var.get() in candidates:
-            candidates.remove(self.active_crop_var.get())
-            candidates.insert(0, self.active_crop_var.get())
+        if self._motion_enabled and active in candidates:
+            candidates.remove(active)
+            candidates.insert(0, active)
 
         target: Optional[str] = None
         mode = "move"
@@ -2500,38 +3060,54 @@ class Application(tk.Tk):
         if target is None:
             self._drag_state = None
             return
-        if target != self.active_crop_var.get():
+        if target != active:
             self.active_crop_var.set(target)
         crop = manual.start if target == "start" else manual.end
-        self._drag_state = {
-            "target": target,
-            "mode": mode,
-            "handle": handle,
-            "start": CropBox(crop.x, crop.y, crop.size),
-            "event": (event.x, event.y),
-        }
+        self._drag_state = _DragState(
+            target=target,
+            mode=mode,
+            handle=handle,
+            start=CropBox(crop.x, crop.y, crop.size),
+            start_x=event.x,
+            start_y=event.y,
+        )
 
     def _on_canvas_drag(self, event: tk.Event) -> None:
-        if not self._drag_state or self.current_image is None or self.current_path is None:
+        if self._drag_state is None:
+            return
+        self._last_drag_position = (event.x, event.y)
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.after_idle(self._flush_drag)
+
+    def _flush_drag(self) -> None:
+        """Apply the most recent pointer position; intermediate motion events are dropped."""
+
+        self._drag_pending = False
+        position = self._last_drag_position
+        self._last_drag_position = None
+        if position is None:
+            return
+        state = self._drag_state
+        if state is None or self.current_image is None or self.current_path is None:
             return
         if self._conversion_active:
             return
         manual = self.manual_crops.get(self.current_path)
         if manual is None:
             return
-        target = self._drag_state.get("target")
+        target = state.target
         if target not in ("start", "end"):
             return
-        start_crop: CropBox = self._drag_state["start"]  # type: ignore[index]
-        mode: str = self._drag_state["mode"]  # type: ignore[index]
-        handle = self._drag_state.get("handle")
-        start_event_x, start_event_y = self._drag_state["event"]  # type: ignore[index]
-        dx_canvas = event.x - start_event_x
-        dy_canvas = event.y - start_event_y
+        start_crop = state.start
+        mode = state.mode
+        handle = state.handle
+        dx_canvas = position[0] - state.start_x
+        dy_canvas = position[1] - state.start_y
         scale = self._canvas_scale or 1.0
         dx = dx_canvas / scale
         dy = dy_canvas / scale
-        width, height = self.current_image.size
+        width, height = self._current_size
         if mode == "move":
             new_crop = CropBox(
                 x=start_crop.x + dx,
@@ -2549,25 +3125,31 @@ class Application(tk.Tk):
             start = new_crop
         else:
             end = new_crop
-        if not self.motion_enabled_var.get():
+        if not self._motion_enabled:
             start = new_crop
             end = new_crop
-        self._update_current_manual(
-            ManualCrop(start=start, end=end),
-            sync_controls=True,
-            auto_generated=False,
-        )
+        # While dragging only the crop items follow the pointer; sliders, crop info
+        # and the remaining overlays are brought up to date once on release.
+        normalized = self._normalize_manual(ManualCrop(start=start, end=end))
+        self.manual_crops[self.current_path] = normalized
+        self._auto_generated_paths.discard(self.current_path)
+        self._render_crop_items(normalized)
+        state.moved = True
 
     def _on_canvas_release(self, _event: tk.Event) -> None:
+        if self._drag_pending:
+            self._flush_drag()
+        state = self._drag_state
         self._drag_state = None
+        if state is None or not state.moved or self.current_path is None:
+            return
+        manual = self.manual_crops.get(self.current_path)
+        if manual is not None:
+            self._update_current_manual(manual, sync_controls=True, auto_generated=False)
 
     def _update_position_label(self) -> None:
-        if not self.image_files or self.current_path is None:
-            self.position_var.set("0/0")
-            return
-        try:
-            index = self.image_files.index(self.current_path)
-        except ValueError:
+        index = self._current_image_index()
+        if index is None:
             self.position_var.set("0/0")
             return
         self.position_var.set(f"{index + 1}/{len(self.image_files)}")
@@ -2579,13 +3161,13 @@ class Application(tk.Tk):
             self.position_var.set("0/0")
             self._update_canvas_navigation(False, False)
             return
-        if self.current_path is None or self.current_path not in self.image_files:
+        index = self._current_image_index()
+        if index is None:
             self.prev_button.state(["disabled"])
             self.next_button.state(["disabled"])
             self.position_var.set(f"0/{len(self.image_files)}")
             self._update_canvas_navigation(False, False)
             return
-        index = self.image_files.index(self.current_path)
         has_prev = index > 0
         has_next = index < len(self.image_files) - 1
         self.prev_button.state(["!disabled"] if has_prev else ["disabled"])
@@ -2594,24 +3176,20 @@ class Application(tk.Tk):
         self._update_canvas_navigation(has_prev, has_next)
 
     def _show_previous_image(self) -> None:
-        if self.current_path is None or self.current_path not in self.image_files:
-            return
-        index = self.image_files.index(self.current_path)
-        if index == 0:
+        index = self._current_image_index()
+        if index is None or index == 0:
             return
         next_path = self.image_files[index - 1]
-        list_index = self._list_paths.index(next_path)
+        list_index = self._list_index[next_path]
         self._select_list_index(list_index)
         self._load_preview(next_path)
 
     def _show_next_image(self) -> None:
-        if self.current_path is None or self.current_path not in self.image_files:
-            return
-        index = self.image_files.index(self.current_path)
-        if index >= len(self.image_files) - 1:
+        index = self._current_image_index()
+        if index is None or index >= len(self.image_files) - 1:
             return
         next_path = self.image_files[index + 1]
-        list_index = self._list_paths.index(next_path)
+        list_index = self._list_index[next_path]
         self._select_list_index(list_index)
         self._load_preview(next_path)
 
@@ -2622,7 +3200,8 @@ class Application(tk.Tk):
 
     def _refresh_output_list(self) -> None:
         self.output_media_files.clear()
-        self.output_listbox.delete(0, tk.END)
+        if self.output_listbox is not None:
+            self.output_listbox.delete(0, tk.END)
         output_dir = self._resolve_output_dir()
         if output_dir is None:
             self.output_info_var.set("Kein Ausgabeordner gewählt.")
@@ -2630,17 +3209,25 @@ class Application(tk.Tk):
         if not output_dir.exists():
             self.output_info_var.set("Ausgabeordner wird beim Konvertieren erstellt.")
             return
-        videos = sorted(path for path in output_dir.iterdir() if is_video(path))
-        for video in videos:
-            self.output_listbox.insert(tk.END, f"🎬 {video.name}")
-            self.output_media_files.append(video)
-        if videos:
-            self.output_info_var.set(f"{len(videos)} Videos im Ausgabeordner.")
+        with os.scandir(output_dir) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in SUPPORTED_VIDEO_EXTS
+                and entry.is_file(follow_symlinks=False)
+            ]
+        # Sort plain strings; Path comparisons rebuild their string keys on every call.
+        names.sort()
+        self.output_media_files = [output_dir / name for name in names]
+        if names and self.output_listbox is not None:
+            self.output_listbox.insert(tk.END, *(f"🎬 {name}" for name in names))
+        if names:
+            self.output_info_var.set(f"{len(names)} Videos im Ausgabeordner.")
         else:
             self.output_info_var.set("Keine Videos im Ausgabeordner.")
 
     def _open_output_file(self, _event: tk.Event) -> None:
-        if not self.output_media_files:
+        if not self.output_media_files or self.output_listbox is None:
             return
         selection = self.output_listbox.curselection()
         if not selection:
@@ -2673,9 +3260,16 @@ class Application(tk.Tk):
         self.convert_button.state(["disabled"])
         self.convert_selected_button.state(["disabled"])
         self.progress_var.set("Konvertierung läuft…")
+        if files_subset is None and self.input_path is not None:
+            # Reuse the listing from the folder import instead of walking the tree again.
+            cached = self._media_cache.get(self.input_path)
+            if cached is not None:
+                files_subset = list(cached)
+        token = object()
+        self._batch_token = token
         thread = threading.Thread(
             target=self._run_batch,
-            args=(output_dir, manual_overrides, files_subset),
+            args=(token, output_dir, manual_overrides, files_subset, self._preloaded_source()),
             daemon=True,
         )
         thread.start()
@@ -2720,11 +3314,22 @@ class Application(tk.Tk):
                 seen.add(path)
         self._start_conversion(output_dir, self._manual_overrides_copy(), unique_paths)
 
+    def _preloaded_source(self) -> Optional[tuple[Path, Image.Image]]:
+        """Return the current preview image if it was decoded at full resolution."""
+
+        if self.current_path is None or self.current_image is None:
+            return None
+        if self.current_image.size != self._current_size:
+            return None
+        return self._normalize_path(self.current_path), self.current_image
+
     def _run_batch(
         self,
+        token: object,
         output_dir: Path,
         manual_overrides: dict[Path, ManualCrop],
         files_subset: Optional[list[Path]] = None,
+        preloaded: Optional[tuple[Path, Image.Image]] = None,
     ) -> None:
         assert self.input_path is not None
         options = ProcessingOptions(
@@ -2739,52 +3344,144 @@ class Application(tk.Tk):
         try:
             logger = setup_environment(options)
         except SystemExit:
-            self.after(0, lambda: self._handle_error("ffmpeg/ffprobe nicht gefunden. Bitte installieren."))
+            self._post_batch(token, self._handle_error, "ffmpeg/ffprobe nicht gefunden. Bitte installieren.")
             return
 
+        # Listed paths, manual crop keys and iter_media_files results all derive from
+        # the resolved input path, so they already compare equal without normalising.
         if files_subset is not None:
-            files = [self._normalize_path(path) for path in files_subset]
+            files = list(files_subset)
         else:
             files = list(iter_media_files(options.input_path))
-            files = [self._normalize_path(path) for path in files]
         total = len(files)
         if total == 0:
-            self.after(0, lambda: self._handle_error("Keine unterstützten Dateien gefunden."))
+            self._post_batch(token, self._handle_error, "Keine unterstützten Dateien gefunden.")
             return
 
-        face_cropper = (
-            FaceCropper(
-                min_face=options.min_face,
-                face_priority=options.face_priority,
-            )
-            if options.face_detection_enabled
-            else None
-        )
-        manual_map = {self._normalize_path(path): crop for path, crop in manual_overrides.items()}
+        manual_map = manual_overrides
 
         processed = 0
-        for path in files:
+        last_post = 0.0
+        # Failures are collected and shown in one dialog at the end instead of one
+        # modal per file.
+        errors: list[tuple[Path, BaseException]] = []
+
+        def _report(path: Path, exc: Optional[BaseException]) -> None:
+            nonlocal processed, last_post
+            if exc is not None:
+                logger.error("Fehler bei %s", path, exc_info=exc)
+                errors.append((path, exc))
+                return
+            processed += 1
+            # At most ~10 label updates per second; the last file is always shown.
+            now = time.monotonic()
+            if processed == total or now - last_post >= self.PROGRESS_INTERVAL:
+                last_post = now
+                self._post_batch(token, self._post_progress, processed, total, path.name)
+
+        # Images are independent and CPU-bound, so they go to a process pool. Every
+        # image job also feeds its own libx264 encoder, hence one worker per two cores.
+        # Videos get a small pool of their own for the same reason. Single leftovers
+        # run here serially.
+        images = [path for path in files if is_image(path)]
+        videos = [path for path in files if not is_image(path)]
+        batches: list[tuple[list[Path], int]] = []
+        if len(images) > 1:
+            batches.append((images, max(1, (os.cpu_count() or 2) // 2)))
+        if len(videos) > 1:
+            batches.append((videos, self.VIDEO_WORKERS))
+        # With NVENC the GPU's session limit caps concurrent encodes as well.
+        batches = [(batch, encode_worker_limit(options, limit)) for batch, limit in batches]
+        pooled = {path for batch, _limit in batches for path in batch}
+        serial = [path for path in files if path not in pooled]
+
+        for pooled_files, limit in batches:
+            workers = min(limit, len(pooled_files))
+            # Never fork the running Tk app: its other threads (preview, thumbnails,
+            # MediaPipe) can leave locks held in the child. Spawn is what Windows
+            # and macOS use anyway. A multiprocessing pool (unlike ProcessPoolExecutor)
+            # can be terminated, so cancelling does not wait for running jobs.
+            pool = multiprocessing.get_context("spawn").Pool(
+                workers, initializer=init_worker, initargs=(options,)
+            )
+            done: queue.Queue[tuple[Path, Optional[BaseException]]] = queue.Queue()
+            unfinished = set(pooled_files)
+            started = time.time()
             try:
-                if is_image(path):
-                    override = manual_map.get(path)
-                    process_image(path, options, face_cropper, manual_crop=override)
-                elif is_video(path):
-                    process_video(path, options, face_cropper)
-                processed += 1
-                self.after(
-                    0,
-                    lambda done=processed, total=total, name=path.name: self.progress_var.set(
-                        f"{done}/{total} verarbeitet – {name}"
-                    ),
+                for path in pooled_files:
+                    pool.apply_async(
+                        process_one,
+                        (path, options, manual_map.get(path)),
+                        callback=lambda _result, path=path: done.put((path, None)),
+                        error_callback=lambda exc, path=path: done.put((path, exc)),
+                    )
+                while unfinished:
+                    if token is not self._batch_token:
+                        # Killed workers leave their ffmpeg to finish truncated clips,
+                        # which a later run would take as up to date.
+                        pool.terminate()
+                        discard_unfinished(unfinished, options, started)
+                        return
+                    try:
+                        path, exc = done.get(timeout=self.CANCEL_POLL_INTERVAL)
+                    except queue.Empty:
+                        continue
+                    unfinished.discard(path)
+                    _report(path, exc)
+                pool.close()
+                pool.join()
+            finally:
+                pool.terminate()
+
+        if serial:
+            from .face_cropper import FaceCropper
+
+            # Reuse the preview's already loaded detector when its settings match.
+            # FaceCropper serialises detection internally, so the preview may keep
+            # detecting meanwhile; tracking state is not locked, but only this thread
+            # tracks (the preview never calls track()).
+            shared = self._preview_cropper
+            if shared is not None and (shared.min_face, shared.face_priority) != (
+                options.min_face,
+                options.face_priority,
+            ):
+                shared = None
+            face_cropper: Optional[FaceCropper] = None
+            if options.face_detection_enabled:
+                face_cropper = shared or FaceCropper(
+                    min_face=options.min_face,
+                    face_priority=options.face_priority,
                 )
-            except Exception as exc:  # pragma: no cover - Fehlerdialog im GUI-Thread
-                logger.exception("Fehler bei %s", path)
-                self.after(0, lambda: messagebox.showerror("Fehler", f"Verarbeitung fehlgeschlagen: {path.name}\n{exc}"))
+            for path in serial:
+                if token is not self._batch_token:
+                    break
+                source_image = preloaded[1] if preloaded is not None and preloaded[0] == path else None
+                try:
+                    process_one(path, options, manual_map.get(path), face_cropper, source_image)
+                except Exception as exc:
+                    _report(path, exc)
+                else:
+                    _report(path, None)
+            if face_cropper is not None and face_cropper is not shared:
+                # Hand the loaded detector to the preview instead of discarding it.
+                if not self._post_batch(token, self._adopt_batch_cropper, face_cropper):
+                    face_cropper.close()
+
+        self._post_batch(token, self._finish_batch, errors)
+
+    def _post_batch(self, token: object, callback: Callable[..., Any], *args: Any) -> bool:
+        """Schedule ``callback`` on the Tk thread unless batch ``token`` was cancelled."""
 
-        if face_cropper is not None:
-            face_cropper.close()
+        if token is not self._batch_token:
+            return False
+        try:
+            self.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):  # window destroyed in the meantime
+            return False
+        return True
 
-        self.after(0, self._finish_batch)
+    def _post_progress(self, done: int, total: int, name: str) -> None:
+        self.progress_var.set(f"{done}/{total} verarbeitet – {name}")
 
     def _handle_error(self, message: str) -> None:
         self.progress_var.set(message)
@@ -2793,12 +3490,19 @@ class Application(tk.Tk):
         self.convert_button.state(["!disabled"])
         self._refresh_selected_button_state()
 
-    def _finish_batch(self) -> None:
+    def _finish_batch(self, errors: Optional[list[tuple[Path, BaseException]]] = None) -> None:
+        self._batch_token = None
         self.progress_var.set("Fertig.")
         self._conversion_active = False
         self.convert_button.state(["!disabled"])
         self._refresh_selected_button_state()
-        messagebox.showinfo("Fertig", "Alle Dateien wurden konvertiert.")
+        if errors:
+            lines = "\n".join(f"• {path.name}: {exc}" for path, exc in errors[:20])
+            if len(errors) > 20:
+                lines += f"\n… und {len(errors) - 20} weitere"
+            messagebox.showerror("Fehler", f"{len(errors)} Dateien fehlgeschlagen:\n{lines}")
+        else:
+            messagebox.showinfo("Fertig", "Alle Dateien wurden konvertiert.")
         self._refresh_output_list()
 
 
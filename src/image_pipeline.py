@@ -1,29 +1,42 @@
-"""Image processing pipeline."""
+"""Image processing pipeline.
+
+OpenCV and the HEIF plugin are imported only where they are needed, so callers
+that only use constants or helpers do not pay for their import.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+import queue
+import subprocess
+import threading
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
-import cv2
 import numpy as np
-import subprocess
 from PIL import Image, ImageOps
-from pillow_heif import register_heif_opener
 
-from .face_cropper import FaceCropper
+try:  # pragma: no cover - optional dependency
+    from turbojpeg import TJPF_RGB, TurboJPEG
+except ImportError:  # pragma: no cover
+    TurboJPEG = None
+
 from .utils import (
     CROP_OVERFLOW_RATIO,
     CropBox,
     ManualCrop,
     ProcessingOptions,
-    clamp,
     normalize_crop_with_overflow,
+    register_heif_opener,
     safe_output_path,
     square_size_for_circle,
+    video_codec_args,
 )
 
-register_heif_opener()
+
+if TYPE_CHECKING:
+    from .face_cropper import DetectionResult, FaceCropper
 
 
 IMAGE_CLIP_DURATION = 5.0
@@ -31,6 +44,23 @@ IMAGE_START_HOLD = 0.5
 IMAGE_END_HOLD = 0.5
 IMAGE_TRANSITION_DURATION = max(0.0, IMAGE_CLIP_DURATION - IMAGE_START_HOLD - IMAGE_END_HOLD)
 DEFAULT_IMAGE_FPS = 30.0
+FRAME_QUEUE_SIZE = 4
+# Detectors run on a box-reduced copy whose longer side is at most about this size.
+DETECTION_MAX_SIDE = 1024
+JPEG_EXTS = {".jpg", ".jpeg"}
+EXIF_ORIENTATION = 0x0112
+# Same mapping as ImageOps.exif_transpose, for pixels decoded outside Pillow.
+EXIF_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
 @dataclass(slots=True)
 class ImageResult:
     source: Path
@@ -63,11 +93,47 @@ def _normalize_crop(
     return normalize_crop_with_overflow(width, height, crop_box, overflow_ratio=ratio)
 
 
+def _bgr_array(img: Image.Image) -> np.ndarray:
+    import cv2
+
+    # process_image already hands over RGB; convert() would only add another full copy.
+    rgb = img if img.mode == "RGB" else img.convert("RGB")
+    # One contiguous BGR copy; the reversed-channel view would be copied again by cv2.
+    return cv2.cvtColor(np.asarray(rgb), cv2.COLOR_RGB2BGR)
+
+
+def _detect_subjects(img: Image.Image, face_cropper: FaceCropper) -> List[DetectionResult]:
+    """Run ``face_cropper`` on a reduced copy of ``img``; boxes are in ``img`` pixels."""
+
+    width, height = img.size
+    factor = max(width, height) // DETECTION_MAX_SIDE
+    if factor <= 1:
+        return face_cropper.detect_subjects(_bgr_array(img))
+    small = img.reduce(factor)
+    detections = face_cropper.detect_subjects(_bgr_array(small))
+    scale_x = width / small.width
+    scale_y = height / small.height
+    return [
+        replace(
+            det,
+            box=CropBox(det.box.x * scale_x, det.box.y * scale_y, det.box.size * scale_x),
+        )
+        for det in detections
+    ]
+
+
 def determine_crop_box(
     img: Image.Image,
     options: ProcessingOptions,
     face_cropper: Optional[FaceCropper],
+    detections: Optional[List[DetectionResult]] = None,
 ) -> CropBox:
+    """Return the still crop for ``img``.
+
+    ``detections`` may carry the result of an earlier ``detect_subjects`` call on
+    the same image so the detector is not run twice.
+    """
+
     width, height = img.size
     base_crop = _center_square(width, height, options.pad)
     auto_detected = False
@@ -76,9 +142,8 @@ def determine_crop_box(
     elif options.mode == "manual" and None not in (options.crop_x, options.crop_y, options.crop_w, options.crop_h):
         crop_box = CropBox(float(options.crop_x), float(options.crop_y), float(min(options.crop_w, options.crop_h)))
     elif options.face_detection_enabled and face_cropper is not None:
-        array = np.array(img.convert("RGB"))
-        array_bgr = array[:, :, ::-1]
-        detections = face_cropper.detect_subjects(array_bgr)
+        if detections is None:
+            detections = _detect_subjects(img, face_cropper)
         crop_box = base_crop
         if detections:
             combined = face_cropper.combine_detections(detections, width, height)
@@ -120,18 +185,16 @@ def determine_motion_manual(
         end = CropBox(normalized.x, normalized.y, normalized.size)
         return ManualCrop(start=start, end=end)
 
-    array = np.array(img.convert("RGB"))
-    array_bgr = array[:, :, ::-1]
-    detections = face_cropper.detect_subjects(array_bgr)
+    detections = _detect_subjects(img, face_cropper)
     if not detections:
-        fallback = determine_crop_box(img, options, face_cropper)
+        fallback = determine_crop_box(img, options, face_cropper, detections)
         start = CropBox(fallback.x, fallback.y, fallback.size)
         end = CropBox(fallback.x, fallback.y, fallback.size)
         return ManualCrop(start=start, end=end)
 
     plan = face_cropper.plan_motion(detections, width, height)
     if plan is None:
-        fallback = determine_crop_box(img, options, face_cropper)
+        fallback = determine_crop_box(img, options, face_cropper, detections)
         start = CropBox(fallback.x, fallback.y, fallback.size)
         end = CropBox(fallback.x, fallback.y, fallback.size)
         return ManualCrop(start=start, end=end)
@@ -157,12 +220,41 @@ def _preferred_fps(options: ProcessingOptions) -> float:
     return max(1.0, fps)
 
 
-def _interpolate_crop(start: CropBox, end: CropBox, fraction: float) -> CropBox:
-    fraction = clamp(fraction, 0.0, 1.0)
-    x = start.x + (end.x - start.x) * fraction
-    y = start.y + (end.y - start.y) * fraction
-    size = start.size + (end.size - start.size) * fraction
-    return CropBox(x=x, y=y, size=size)
+def _motion_boxes(start: CropBox, end: CropBox, count: int) -> np.ndarray:
+    """Return ``(count, 3)`` rows of ``x, y, size`` easing from ``start`` to ``end``."""
+
+    linear = np.arange(1, count + 1, dtype=np.float64) / (count + 1)
+    fraction = np.clip(linear * linear * (3 - 2 * linear), 0.0, 1.0)
+    first = np.array([start.x, start.y, start.size])
+    last = np.array([end.x, end.y, end.size])
+    return first + (last - first) * fraction[:, None]
+
+
+def _frame_schedule(fps: float, duration: float, motion_enabled: bool) -> Tuple[int, int, int]:
+    """Return ``(start_hold, motion, end_hold)`` frame counts for a photo clip."""
+
+    total_frames = max(1, int(round(duration * fps)))
+    if not motion_enabled:
+        return total_frames, 0, 0
+
+    start_hold_frames = max(1, int(round(IMAGE_START_HOLD * fps)))
+    end_hold_frames = max(1, int(round(IMAGE_END_HOLD * fps)))
+    desired_motion_frames = max(0, int(round(IMAGE_TRANSITION_DURATION * fps)))
+    available = max(0, total_frames - start_hold_frames - end_hold_frames)
+    motion_frames = min(available, desired_motion_frames)
+    leftover = total_frames - (start_hold_frames + end_hold_frames + motion_frames)
+    if leftover > 0:
+        motion_frames += leftover
+    remainder = total_frames - (start_hold_frames + end_hold_frames + motion_frames)
+    if remainder < 0:
+        reduction = -remainder
+        reduce_start = min(reduction, start_hold_frames - 1)
+        start_hold_frames -= reduce_start
+        reduction -= reduce_start
+        if reduction > 0:
+            end_hold_frames = max(0, end_hold_frames - reduction)
+        motion_frames = max(0, total_frames - start_hold_frames - end_hold_frames)
+    return start_hold_frames, motion_frames, end_hold_frames
 
 
 def _iter_motion_frames(
@@ -170,60 +262,111 @@ def _iter_motion_frames(
     start: CropBox,
     end: CropBox,
     target: int,
-    fps: float,
-    duration: float,
+    schedule: Tuple[int, int, int],
     motion_enabled: bool,
 ) -> Iterable[np.ndarray]:
-    total_frames = max(1, int(round(duration * fps)))
-    rgb_image = image.convert("RGB")
-
-    def render_crop(crop_box: CropBox) -> np.ndarray:
-        cropped = rgb_image.crop(crop_box.as_tuple())
-        resized = cropped.resize((target, target), Image.Resampling.LANCZOS)
-        return np.asarray(resized, dtype=np.uint8)
-
-    if not motion_enabled:
-        start_hold_frames = total_frames
-        end_hold_frames = 0
-        motion_frames = 0
-    else:
-        start_hold_frames = max(1, int(round(IMAGE_START_HOLD * fps)))
-        end_hold_frames = max(1, int(round(IMAGE_END_HOLD * fps)))
-        desired_motion_frames = max(0, int(round(IMAGE_TRANSITION_DURATION * fps)))
-        available = max(0, total_frames - start_hold_frames - end_hold_frames)
-        motion_frames = min(available, desired_motion_frames)
-        leftover = total_frames - (start_hold_frames + end_hold_frames + motion_frames)
-        if leftover > 0:
-            motion_frames += leftover
-        remainder = total_frames - (start_hold_frames + end_hold_frames + motion_frames)
-        if remainder < 0:
-            reduction = -remainder
-            reduce_start = min(reduction, start_hold_frames - 1)
-            start_hold_frames -= reduce_start
-            reduction -= reduce_start
-            if reduction > 0:
-                end_hold_frames = max(0, end_hold_frames - reduction)
-            motion_frames = max(0, total_frames - start_hold_frames - end_hold_frames)
-
-    start_frame = render_crop(start)
-    end_frame = render_crop(end)
-
-    for _ in range(start_hold_frames):
+    """Yield the clip frames with each hold emitted once.
+
+    The encoder repeats the first and last frame for the remaining hold frames
+    (see ``_encode_video``), so identical buffers never cross the pipe twice.
+    Every frame is a fresh C-contiguous ``uint8`` array of shape
+    ``(target, target, 3)`` straight from OpenCV, ready to be written as is.
+    """
+
+    import cv2
+
+    start_hold_frames, motion_frames, end_hold_frames = schedule
+    rgb_image = image if image.mode == "RGB" else image.convert("RGB")
+    source = np.asarray(rgb_image)
+    source_height, source_width = source.shape[:2]
+
+    # Only the area the clip ever shows is kept, shrunk once with INTER_AREA so the
+    # smallest crop keeps about ``target`` pixels and, while the crops differ by at
+    # most 2x, the largest one is minified no more than 2x. Such frames are one
+    # bilinear warpAffine on that small copy, which also places the crop with
+    # sub-pixel precision; areas outside the image stay black. Crops more than 2x
+    # larger than ``target`` there (a strong zoom) would alias under bilinear
+    # sampling and are area-averaged with INTER_AREA instead.
+    left = max(0, math.floor(min(start.x, end.x)) - 1)
+    top = max(0, math.floor(min(start.y, end.y)) - 1)
+    right = min(source_width, math.ceil(max(start.x + start.size, end.x + end.size)) + 1)
+    bottom = min(source_height, math.ceil(max(start.y + start.size, end.y + end.size)) + 1)
+    if right <= left or bottom <= top:  # pragma: no cover - crop entirely off-image
+        left, top, right, bottom = 0, 0, source_width, source_height
+    source = source[top:bottom, left:right]
+    region_width, region_height = right - left, bottom - top
+
+    sizes = (start.size, end.size)
+    scale = min(1.0, max(target / min(sizes), 2 * target / max(sizes)))
+    if scale < 1.0:
+        reduced_size = (max(1, round(region_width * scale)), max(1, round(region_height * scale)))
+        source = cv2.resize(source, reduced_size, interpolation=cv2.INTER_AREA)
+    reduced_height, reduced_width = source.shape[:2]
+    scale_x = reduced_width / region_width
+    scale_y = reduced_height / region_height
+
+    def area_crop(x: float, y: float, size_x: float, size_y: float) -> np.ndarray:
+        # Whole source pixels are off by at most 1/4 output pixel at this scale.
+        x0, y0 = round(x), round(y)
+        x1, y1 = x0 + max(1, round(size_x)), y0 + max(1, round(size_y))
+        inside = source[max(0, y0) : min(reduced_height, y1), max(0, x0) : min(reduced_width, x1)]
+        if inside.size == 0:  # pragma: no cover - crop entirely off-image
+            return np.zeros((target, target, 3), dtype=np.uint8)
+        padded = cv2.copyMakeBorder(
+            inside,
+            max(0, -y0),
+            max(0, y1 - reduced_height),
+            max(0, -x0),
+            max(0, x1 - reduced_width),
+            cv2.BORDER_CONSTANT,
+            value=0,
+        )
+        return cv2.resize(padded, (target, target), interpolation=cv2.INTER_AREA)
+
+    def render_crop(x: float, y: float, size: float) -> np.ndarray:
+        step_x = size * scale_x / target
+        step_y = size * scale_y / target
+        if step_x > 2.0:
+            return area_crop((x - left) * scale_x, (y - top) * scale_y, size * scale_x, size * scale_y)
+        # Maps output pixel centres back into the (reduced) source.
+        matrix = np.array(
+            [
+                [step_x, 0.0, (x - left) * scale_x + 0.5 * step_x - 0.5],
+                [0.0, step_y, (y - top) * scale_y + 0.5 * step_y - 0.5],
+            ]
+        )
+        interpolation = cv2.INTER_LINEAR if step_x >= 1.0 else cv2.INTER_LANCZOS4
+        return cv2.warpAffine(
+            source,
+            matrix,
+            (target, target),
+            flags=interpolation | cv2.WARP_INVERSE_MAP,
+            borderMode=cv2.BORDER_CONSTANT,
+            borderValue=0,
+        )
+
+    # A crop that did not move since the previous frame reuses that frame.
+    start_box = (start.x, start.y, start.size)
+    end_box = (end.x, end.y, end.size)
+    start_frame = render_crop(*start_box)
+    end_frame = start_frame if end_box == start_box else render_crop(*end_box)
+
+    if start_hold_frames > 0:
         yield start_frame
 
     if motion_enabled and motion_frames > 0:
-        steps = motion_frames + 1
-        for index in range(motion_frames):
-            linear = (index + 1) / steps
-            eased = linear * linear * (3 - 2 * linear)
-            fraction = clamp(eased, 0.0, 1.0)
-            crop = _interpolate_crop(start, end, fraction)
-            yield render_crop(crop)
+        previous_box = start_box
+        frame = start_frame
+        for box in map(tuple, _motion_boxes(start, end, motion_frames).tolist()):
+            if box != previous_box:
+                previous_box = box
+                frame = render_crop(*box)
+            yield frame
     else:
         for _ in range(max(0, motion_frames)):
             yield start_frame
 
-    for _ in range(end_hold_frames):
+    if end_hold_frames > 0:
         yield end_frame
 
 
@@ -233,7 +376,19 @@ def _encode_video(
     fps: float,
     size: int,
     options: ProcessingOptions,
+    start_pad: int = 0,
+    end_pad: int = 0,
+    still: bool = False,
 ) -> None:
+    # ffmpeg clones the first/last frame for held segments instead of receiving
+    # the same buffer over the pipe once per frame.
+    pad_filters = []
+    if start_pad > 0:
+        pad_filters.append(f"start_mode=clone:start={start_pad}")
+    if end_pad > 0:
+        pad_filters.append(f"stop_mode=clone:stop={end_pad}")
+    filter_args = ["-vf", "tpad=" + ":".join(pad_filters)] if pad_filters else []
+
     ffmpeg_cmd = [
         "ffmpeg",
         "-y",
@@ -250,12 +405,8 @@ def _encode_video(
         "-i",
         "pipe:0",
         "-an",
-        "-c:v",
-        "libx264",
-        "-preset",
-        options.preset,
-        "-crf",
-        str(options.crf),
+        *filter_args,
+        *video_codec_args(options, still_image=still),
         "-pix_fmt",
         "yuv420p",
         str(path),
@@ -263,21 +414,98 @@ def _encode_video(
 
     proc = subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE)
     assert proc.stdin is not None
-
+    stdin = proc.stdin
+
+    # Rendering and the pipe write both release the GIL; a writer thread lets the
+    # next frame render while ffmpeg consumes the previous one.
+    pending: queue.Queue[Optional[np.ndarray]] = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+    write_errors: list[OSError] = []
+
+    def writer() -> None:
+        while True:
+            frame = pending.get()
+            if frame is None:
+                return
+            if write_errors:
+                continue  # keep draining so the producer never blocks
+            try:
+                # Write the array's buffer directly; tobytes() would copy every frame.
+                stdin.write(frame.data)
+            except OSError as exc:
+                write_errors.append(exc)
+
+    thread = threading.Thread(target=writer, name="ffmpeg-writer", daemon=True)
+    thread.start()
     try:
         for frame in frames:
             if frame.shape != (size, size, 3):  # pragma: no cover - defensive
                 raise RuntimeError(
                     f"Ungültige Framegröße {frame.shape}, erwartet {(size, size, 3)}"
                 )
-            rgb = np.ascontiguousarray(frame)
-            proc.stdin.write(rgb.tobytes())
+            # _iter_motion_frames only yields C-contiguous arrays, so the buffer
+            # can go to the pipe without an ascontiguousarray pass.
+            pending.put(frame)
     finally:
-        proc.stdin.close()
+        pending.put(None)
+        thread.join()
+        stdin.close()
         proc.wait()
 
     if proc.returncode != 0:
         raise RuntimeError(f"ffmpeg fehlgeschlagen für {path}")
+    if write_errors:
+        raise write_errors[0]
+
+
+@lru_cache(maxsize=1)
+def _turbo_decoder() -> Optional["TurboJPEG"]:
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError):  # pragma: no cover - libturbojpeg not found
+        return None
+
+
+def _decode_jpeg(path: Path) -> Optional[Image.Image]:
+    """Decode a JPEG with libjpeg-turbo if PyTurboJPEG is installed, else ``None``."""
+
+    decoder = _turbo_decoder()
+    if decoder is None or path.suffix.lower() not in JPEG_EXTS:
+        return None
+    try:
+        # Opening only parses the header; the orientation tag is all we need from PIL.
+        with Image.open(path) as probe:
+            orientation = probe.getexif().get(EXIF_ORIENTATION, 1)
+        pixels = decoder.decode(path.read_bytes(), pixel_format=TJPF_RGB)
+    except (OSError, ValueError):
+        return None  # let Pillow handle (and report) anything unusual
+    img = Image.fromarray(pixels)
+    method = EXIF_TRANSPOSE.get(orientation)
+    return img.transpose(method) if method is not None else img
+
+
+def _load_source_image(path: Path, source_image: Optional[Image.Image]) -> Image.Image:
+    """Return ``path`` decoded, upright and in RGB, copying the pixels at most once."""
+
+    # ``source_image`` is an already decoded full-resolution copy of ``path``;
+    # exif_transpose always returns a new image, so the caller's copy stays untouched.
+    # The pipeline only reads the pixels, so an upright source is used as is.
+    if source_image is not None:
+        if source_image.getexif().get(EXIF_ORIENTATION, 1) == 1:
+            img = source_image
+        else:
+            img = ImageOps.exif_transpose(source_image)
+    elif (decoded := _decode_jpeg(path)) is not None:
+        return decoded
+    else:
+        if path.suffix.lower() in (".heic", ".heif"):
+            register_heif_opener()
+        with Image.open(path) as img:
+            img.load()
+            # The freshly decoded file is ours to modify.
+            ImageOps.exif_transpose(img, in_place=True)
+    return img if img.mode == "RGB" else img.convert("RGB")
 
 
 def process_image(
@@ -285,6 +513,7 @@ def process_image(
     options: ProcessingOptions,
     face_cropper: Optional[FaceCropper],
     manual_crop: Optional[ManualCrop] = None,
+    source_image: Optional[Image.Image] = None,
 ) -> ImageResult:
     output_path = safe_output_path(options.output_dir, path, options.size, options.image_format, options.video_ext)
     video_suffix = f".{options.video_ext.lower()}"
@@ -294,36 +523,45 @@ def process_image(
     if output_path.exists() and output_path.stat().st_mtime >= path.stat().st_mtime:
         return ImageResult(source=path, target=output_path, processed=False)
 
-    with Image.open(path) as img:
-        img = ImageOps.exif_transpose(img)
-        width, height = img.size
+    img = _load_source_image(path, source_image)
+    width, height = img.size
 
-        if manual_crop is not None:
-            start_crop = _normalize_crop(width, height, manual_crop.start, allow_overflow=True)
-            end_crop = _normalize_crop(width, height, manual_crop.end, allow_overflow=True)
+    if manual_crop is not None:
+        start_crop = _normalize_crop(width, height, manual_crop.start, allow_overflow=True)
+        end_crop = _normalize_crop(width, height, manual_crop.end, allow_overflow=True)
+    else:
+        if options.motion_enabled:
+            auto_manual = determine_motion_manual(img, options, face_cropper)
+            start_crop = _normalize_crop(width, height, auto_manual.start, allow_overflow=False)
+            end_crop = _normalize_crop(width, height, auto_manual.end, allow_overflow=False)
         else:
-            if options.motion_enabled:
-                auto_manual = determine_motion_manual(img, options, face_cropper)
-                start_crop = _normalize_crop(width, height, auto_manual.start, allow_overflow=False)
-                end_crop = _normalize_crop(width, height, auto_manual.end, allow_overflow=False)
-            else:
-                auto_crop = determine_crop_box(img, options, face_cropper)
-                start_crop = _normalize_crop(width, height, auto_crop, allow_overflow=False)
-                end_crop = start_crop
+            auto_crop = determine_crop_box(img, options, face_cropper)
+            start_crop = _normalize_crop(width, height, auto_crop, allow_overflow=False)
+            end_crop = start_crop
 
-        if not options.motion_enabled:
-            start_crop = CropBox(end_crop.x, end_crop.y, end_crop.size)
+    if not options.motion_enabled:
+        start_crop = CropBox(end_crop.x, end_crop.y, end_crop.size)
 
     fps = _preferred_fps(options)
+    schedule = _frame_schedule(fps, IMAGE_CLIP_DURATION, options.motion_enabled)
+    start_hold_frames, _, end_hold_frames = schedule
     frames = _iter_motion_frames(
         img,
         start_crop,
         end_crop,
         options.size,
-        fps,
-        IMAGE_CLIP_DURATION,
+        schedule,
         options.motion_enabled,
     )
-    _encode_video(frames, output_path, fps, options.size, options)
+    _encode_video(
+        frames,
+        output_path,
+        fps,
+        options.size,
+        options,
+        start_pad=max(0, start_hold_frames - 1),
+        end_pad=max(0, end_hold_frames - 1),
+        still=start_crop == end_crop,
+    )
     return ImageResult(source=path, target=output_path, processed=True)
 
@@ -8,6 +8,7 @@ import os
 import subprocess
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
 
@@ -155,6 +156,7 @@ class ProcessingOptions:
     quality: int = 90
     crf: int = 20
     preset: str = "medium"
+    video_encoder: str = "auto"
     mode: str = "auto"
     crop_x: Optional[int] = None
     crop_y: Optional[int] = None
@@ -203,13 +205,76 @@ def get_logger(level: str) -> logging.Logger:
     return logging.getLogger("memoryball-autocrop")
 
 
+# Nur ein Treffer wird gemerkt: wer FFmpeg bei laufender GUI nachinstalliert, soll
+# beim nächsten Batch nicht weiter die Fehlermeldung sehen.
+_FFMPEG_FOUND = False
+
+
 def ffmpeg_available() -> bool:
+    global _FFMPEG_FOUND
+    if _FFMPEG_FOUND:
+        return True
     try:
         subprocess.run(["ffmpeg", "-version"], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         subprocess.run(["ffprobe", "-version"], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return True
     except (OSError, subprocess.CalledProcessError):
         return False
+    _FFMPEG_FOUND = True
+    return True
+
+
+@lru_cache(maxsize=None)
+def nvenc_available() -> bool:
+    # Viele ffmpeg-Builds listen h264_nvenc auch ohne NVIDIA-GPU; nur ein Testframe ist verlässlich.
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        "color=c=black:s=256x256",
+        "-frames:v",
+        "1",
+        "-c:v",
+        "h264_nvenc",
+        "-f",
+        "null",
+        "-",
+    ]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=15)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return True
+
+
+def resolve_video_encoder(options: ProcessingOptions) -> str:
+    if options.video_encoder != "auto":
+        return options.video_encoder
+    return "h264_nvenc" if nvenc_available() else "libx264"
+
+
+# Consumer-GeForce-Treiber lassen nur wenige gleichzeitige NVENC-Sitzungen zu.
+NVENC_MAX_SESSIONS = 3
+
+
+def encode_worker_limit(options: ProcessingOptions, requested: int) -> int:
+    if resolve_video_encoder(options) == "h264_nvenc":
+        return max(1, min(requested, NVENC_MAX_SESSIONS))
+    return max(1, requested)
+
+
+def video_codec_args(options: ProcessingOptions, still_image: bool = False) -> List[str]:
+    if resolve_video_encoder(options) == "h264_nvenc":
+        # NVENC kennt weder CRF noch die x264-Presets; -cq ist das Pendant zur CRF.
+        return ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", str(options.crf), "-b:v", "0"]
+    args = ["-c:v", "libx264", "-preset", options.preset, "-crf", str(options.crf)]
+    if still_image:
+        # Nur für Fotoclips ohne Bewegung: ein einziges Standbild, das gehalten wird.
+        args.extend(["-tune", "stillimage"])
+    return args
 
 
 def run_ffprobe(path: Path) -> dict:
@@ -227,15 +292,29 @@ def run_ffprobe(path: Path) -> dict:
     return json.loads(proc.stdout.decode("utf-8"))
 
 
+_MEDIA_EXTS = frozenset(SUPPORTED_IMAGE_EXTS | SUPPORTED_VIDEO_EXTS)
+
+
 def iter_media_files(input_path: Path) -> Iterable[Path]:
     if input_path.is_file():
         yield input_path
         return
-    for root, _dirs, files in os.walk(input_path):
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext in SUPPORTED_IMAGE_EXTS or ext in SUPPORTED_VIDEO_EXTS:
-                yield Path(root) / file
+    # Top-down like os.walk, but DirEntry.is_file/is_dir use the cached directory
+    # entry type, so no extra stat per file and no Path for non-media entries.
+    pending = [os.fspath(input_path)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in _MEDIA_EXTS and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+        pending.extend(reversed(subdirs))
 
 
 def is_image(path: Path) -> bool:
@@ -276,10 +355,37 @@ def with_margin(box: CropBox, margin: float, width: int, height: int) -> CropBox
     return CropBox(x=x, y=y, size=size)
 
 
+@lru_cache(maxsize=None)
+def register_heif_opener() -> None:
+    """Teach Pillow to open HEIC/HEIF files; the plugin is imported on first use."""
+
+    import pillow_heif
+
+    # libheif dekodiert die Kacheln eines iPhone-Fotos parallel; Vorschaubilder
+    # im Container werden nie gebraucht.
+    pillow_heif.options.DECODE_THREADS = max(1, os.cpu_count() or 4)
+    pillow_heif.options.THUMBNAILS = False
+    pillow_heif.register_heif_opener()
+
+
+def pillow_simd_active() -> bool:
+    # Pillow-SIMD veröffentlicht seine Builds als ``<pillow-version>.postN``.
+    import PIL
+
+    return ".post" in getattr(PIL, "__version__", "")
+
+
 def setup_environment(options: ProcessingOptions) -> logging.Logger:
     ensure_dir(options.output_dir)
     logger = get_logger(options.log_level)
+    logger.debug(
+        "Pillow-Backend: %s",
+        "Pillow-SIMD" if pillow_simd_active() else "Pillow (ohne SIMD-Resize)",
+    )
     if not ffmpeg_available():
         logger.error("ffmpeg/ffprobe nicht gefunden. Bitte installieren und in PATH aufnehmen.")
         sys.exit(1)
+    # Einmal hier auflösen, damit Worker-Prozesse den Encoder nicht erneut testen.
+    options.video_encoder = resolve_video_encoder(options)
+    logger.debug("Video-Encoder: %s", options.video_encoder)
     return logger
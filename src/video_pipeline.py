@@ -1,7 +1,10 @@
 """Video processing pipeline."""
 from __future__ import annotations
 
+import contextlib
+import queue
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Optional
@@ -15,12 +18,15 @@ from .utils import (
     CropBox,
     ProcessingOptions,
     normalize_crop_with_overflow,
-    run_ffprobe,
     safe_output_path,
     square_size_for_circle,
+    video_codec_args,
 )
 
 
+FRAME_QUEUE_SIZE = 4
+
+
 @dataclass(slots=True)
 class VideoResult:
     source: Path
@@ -38,26 +44,52 @@ def _center_crop(width: int, height: int, pad: float = 0.0) -> CropBox:
     return CropBox(x=x, y=y, size=size)
 
 
-def _compute_crop(frame: np.ndarray, options: ProcessingOptions, face_cropper: Optional[FaceCropper], fallback: CropBox) -> CropBox:
-    height, width = frame.shape[:2]
+def _static_crop(
+    width: int,
+    height: int,
+    options: ProcessingOptions,
+    face_cropper: Optional[FaceCropper],
+    fallback: CropBox,
+) -> Optional[CropBox]:
+    """Return the crop shared by every frame, or ``None`` when it follows the subject."""
+
     if options.mode == "center":
         crop = fallback
     elif options.mode == "manual" and None not in (options.crop_x, options.crop_y, options.crop_w, options.crop_h):
         crop = CropBox(float(options.crop_x), float(options.crop_y), float(min(options.crop_w, options.crop_h)))
     elif options.face_detection_enabled and face_cropper is not None:
-        crop = face_cropper.track(frame, width, height, fallback)
+        return None
     else:
         crop = fallback
+    return _normalize_frame_crop(width, height, crop, options)
+
+
+def _normalize_frame_crop(width: int, height: int, crop: CropBox, options: ProcessingOptions) -> CropBox:
     allow_overflow = options.mode == "manual"
     overflow_ratio = CROP_OVERFLOW_RATIO if allow_overflow else 0.0
     return normalize_crop_with_overflow(width, height, crop, overflow_ratio=overflow_ratio)
 
 
+def _compute_crop(frame: np.ndarray, options: ProcessingOptions, face_cropper: Optional[FaceCropper], fallback: CropBox) -> CropBox:
+    height, width = frame.shape[:2]
+    crop = _static_crop(width, height, options, face_cropper, fallback)
+    if crop is not None:
+        return crop
+    assert face_cropper is not None
+    crop = face_cropper.track(frame, width, height, fallback)
+    return _normalize_frame_crop(width, height, crop, options)
+
+
 def _crop_frame_with_padding(frame: np.ndarray, crop_box: CropBox) -> np.ndarray:
-    """Extract a square crop, padding with black when outside the frame bounds."""
+    """Extract a square crop, padding with black when outside the frame bounds.
+
+    A crop that lies inside the frame is returned as a view without copying.
+    """
 
     height, width = frame.shape[:2]
     x1, y1, x2, y2 = crop_box.as_tuple()
+    if 0 <= x1 < x2 <= width and 0 <= y1 < y2 <= height and x2 - x1 == y2 - y1:
+        return frame[y1:y2, x1:x2]
     size = max(1, max(x2 - x1, y2 - y1))
     channels = frame.shape[2] if frame.ndim == 3 else 1
     result = np.zeros((size, size, channels), dtype=frame.dtype)
@@ -79,12 +111,60 @@ def _crop_frame_with_padding(frame: np.ndarray, crop_box: CropBox) -> np.ndarray
     return result
 
 
+def _crop_filter(crop_box: CropBox, width: int, height: int) -> Optional[str]:
+    """ffmpeg filter equivalent of ``_crop_frame_with_padding`` for a fixed crop."""
+
+    x1, y1, x2, y2 = crop_box.as_tuple()
+    size = max(1, max(x2 - x1, y2 - y1))
+    src_x1 = max(0, x1)
+    src_y1 = max(0, y1)
+    src_x2 = min(width, x2)
+    src_y2 = min(height, y2)
+    if src_x2 <= src_x1 or src_y2 <= src_y1:
+        return None
+    crop = f"crop={src_x2 - src_x1}:{src_y2 - src_y1}:{src_x1}:{src_y1}:exact=1"
+    if (src_x2 - src_x1, src_y2 - src_y1) == (size, size):
+        return crop
+    return f"{crop},pad={size}:{size}:{src_x1 - x1}:{src_y1 - y1}:black"
+
+
 def _iter_frames(cap: cv2.VideoCapture) -> Iterator[np.ndarray]:
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        yield frame
+    """Yield the decoded frames of ``cap``.
+
+    ``cap.read()`` releases the GIL, so a reader thread decodes the next frames
+    while the caller is still tracking and resizing the current one.
+    """
+
+    frames: queue.Queue[Optional[np.ndarray]] = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+    stop = threading.Event()
+    read_errors: list[Exception] = []
+
+    def reader() -> None:
+        try:
+            while not stop.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                frames.put(frame)
+        except Exception as exc:  # pragma: no cover - surfaced in the caller
+            read_errors.append(exc)
+        finally:
+            frames.put(None)
+
+    thread = threading.Thread(target=reader, name="video-reader", daemon=True)
+    thread.start()
+    try:
+        while (frame := frames.get()) is not None:
+            yield frame
+    finally:
+        # Unblock a reader waiting on a full queue; ``cap`` must be idle before release.
+        stop.set()
+        while thread.is_alive():
+            with contextlib.suppress(queue.Empty):
+                frames.get(timeout=0.1)
+        thread.join()
+    if read_errors:
+        raise read_errors[0]
 
 
 def process_video(path: Path, options: ProcessingOptions, face_cropper: Optional[FaceCropper]) -> VideoResult:
@@ -106,9 +186,54 @@ def process_video(path: Path, options: ProcessingOptions, face_cropper: Optional
         fps_out = fps
 
     fallback = _center_crop(width, height, options.pad)
+    if face_cropper is not None:
+        # Croppers are reused across files; the last video's box must not limit this one.
+        face_cropper.reset_tracking()
+
+    if options.keep_audio:
+        # The trailing "?" makes the audio map optional, so clips without sound need
+        # no ffprobe round trip beforehand.
+        audio_args = ["-map", "0:a:0?"]
+        if options.fps == "keep":
+            audio_args.extend(["-c:a", "copy"])
+        else:
+            audio_args.extend(["-c:a", "aac", "-b:a", "192k"])
+    else:
+        audio_args = ["-an"]
+    output_args = [
+        *audio_args,
+        *video_codec_args(options),
+        "-pix_fmt",
+        "yuv420p",
+        "-r",
+        f"{fps_out}",
+        str(output_path),
+    ]
 
-    ffprobe_data = run_ffprobe(path)
-    has_audio = any(stream.get("codec_type") == "audio" for stream in ffprobe_data.get("streams", []))
+    static_crop = None
+    if options.fps == "keep":
+        static_crop = _static_crop(width, height, options, face_cropper, fallback)
+    crop_filter = _crop_filter(static_crop, width, height) if static_crop is not None else None
+    if crop_filter is not None:
+        # Without tracking the crop never moves: ffmpeg crops and scales on its own,
+        # with no per-frame decode, resize and pipe round trip through Python.
+        cap.release()
+        filter_cmd = [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-i",
+            str(path),
+            "-map",
+            "0:v:0",
+            "-vf",
+            f"{crop_filter},scale={options.size}:{options.size}:flags=lanczos",
+            *output_args,
+        ]
+        if subprocess.run(filter_cmd).returncode != 0:
+            raise RuntimeError(f"ffmpeg fehlgeschlagen für {path}")
+        return VideoResult(source=path, target=output_path, processed=True)
 
     ffmpeg_cmd = [
         "ffmpeg",
@@ -120,7 +245,7 @@ def process_video(path: Path, options: ProcessingOptions, face_cropper: Optional
         "-f",
         "rawvideo",
         "-pix_fmt",
-        "rgb24",
+        "bgr24",
         "-s",
         f"{options.size}x{options.size}",
         "-r",
@@ -129,38 +254,22 @@ def process_video(path: Path, options: ProcessingOptions, face_cropper: Optional
         "pipe:0",
         "-map",
         "1:v:0",
+        *output_args,
     ]
-    if options.keep_audio and has_audio:
-        ffmpeg_cmd.extend(["-map", "0:a:0"])
-        if options.fps == "keep":
-            ffmpeg_cmd.extend(["-c:a", "copy"])
-        else:
-            ffmpeg_cmd.extend(["-c:a", "aac", "-b:a", "192k"])
-    else:
-        ffmpeg_cmd.append("-an")
-    ffmpeg_cmd.extend([
-        "-c:v",
-        "libx264",
-        "-preset",
-        options.preset,
-        "-crf",
-        str(options.crf),
-        "-pix_fmt",
-        "yuv420p",
-        "-r",
-        f"{fps_out}",
-        str(output_path),
-    ])
 
     proc = subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE)
     assert proc.stdin is not None
 
-    for frame in _iter_frames(cap):
-        crop_box = _compute_crop(frame, options, face_cropper, fallback)
-        cropped = _crop_frame_with_padding(frame, crop_box)
-        resized = cv2.resize(cropped, (options.size, options.size), interpolation=cv2.INTER_LANCZOS4)
-        rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-        proc.stdin.write(rgb.tobytes())
+    with contextlib.closing(_iter_frames(cap)) as frames:
+        for frame in frames:
+            crop_box = _compute_crop(frame, options, face_cropper, fallback)
+            cropped = _crop_frame_with_padding(frame, crop_box)
+            # Heavy downscales average whole source blocks; Lanczos would only alias there.
+            interpolation = cv2.INTER_AREA if cropped.shape[0] > 2 * options.size else cv2.INTER_LANCZOS4
+            resized = cv2.resize(cropped, (options.size, options.size), interpolation=interpolation)
+            # ffmpeg reads OpenCV's BGR order directly (bgr24), so frames need neither a
+            # colour conversion nor a bytes copy.
+            proc.stdin.write(resized.data)
 
     proc.stdin.close()
     cap.release()
@@ -10,19 +10,17 @@ successfully.
 """
 from __future__ import annotations
 
+import hashlib
 import itertools
 import os
 import shutil
 import subprocess
 import sys
-import tempfile
 import threading
-import time
-import zipfile
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Iterator, List
-from urllib.request import urlopen
 
 BASE_DIR = Path(__file__).resolve().parent
 MAIN_FILE = BASE_DIR / "main.py"
@@ -30,18 +28,46 @@ REQUIREMENTS_FILE = BASE_DIR / "requirements.txt"
 VENV_DIR = BASE_DIR / "venv"
 VENV_BIN = VENV_DIR / ("Scripts" if os.name == "nt" else "bin")
 VENV_PYTHON = VENV_BIN / ("python.exe" if os.name == "nt" else "python")
+REQUIREMENTS_STAMP = VENV_DIR / ".requirements.sha256"
+# Ältere pip-Versionen lösen die Abhängigkeiten nicht zuverlässig auf.
+MIN_PIP_VERSION = (23, 0)
+# Liegt neben dem venv, damit die Wheels ein Neuanlegen der Umgebung überstehen.
+PIP_CACHE_DIR = BASE_DIR / ".pip-cache"
+PIP_FLAGS = [
+    "--require-virtualenv",
+    "--disable-pip-version-check",
+    "--no-input",
+    "--prefer-binary",
+    "--cache-dir",
+    str(PIP_CACHE_DIR),
+]
 FFMPEG_BINARIES = ["ffmpeg.exe", "ffprobe.exe"] if os.name == "nt" else ["ffmpeg", "ffprobe"]
 FFMPEG_FALLBACK_DIR = BASE_DIR / "ffmpeg-bin"
+FFMPEG_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+FFMPEG_CACHE_DIR = BASE_DIR / ".cache"
+DOWNLOAD_WORKERS = 6
+DOWNLOAD_ATTEMPTS = 3
+DOWNLOAD_CHUNK = 4 << 20
 
 _PATH_PREFIXES: list[str] = []
 
 
 def _build_env(extra_paths: Iterable[str] | None = None) -> dict[str, str]:
+    """Return a fresh environment dict for a child process.
+
+    ``os.environ`` is snapshotted once per set of PATH prefixes, when that set is
+    first used; later changes to ``os.environ`` are not picked up. Callers get
+    their own copy and may modify it freely.
+    """
+
+    return dict(_env_with_paths(tuple(extra_paths or ()) + tuple(_PATH_PREFIXES)))
+
+
+@lru_cache(maxsize=None)
+def _env_with_paths(paths: tuple[str, ...]) -> dict[str, str]:
+    # Nur PATH hängt vom Aufruf ab; das Zusammensetzen passiert je Präfix-Stand einmal.
+    # Der zwischengespeicherte Dict wird nie herausgegeben, siehe _build_env.
     env = os.environ.copy()
-    paths: list[str] = []
-    if extra_paths:
-        paths.extend(extra_paths)
-    paths.extend(_PATH_PREFIXES)
     if paths:
         original = env.get("PATH", "")
         env["PATH"] = os.pathsep.join([*(p for p in paths if p), original]) if original else os.pathsep.join(
@@ -54,13 +80,16 @@ def _build_env(extra_paths: Iterable[str] | None = None) -> dict[str, str]:
 def _activity_indicator(message: str) -> Iterator[None]:
     stop_event = threading.Event()
 
+    frames = itertools.cycle([f"\r{message} {char}" for char in "|/-\\"])
+    blank = "\r" + " " * (len(message) + 2) + "\r"
+
     def _worker() -> None:
-        spinner = itertools.cycle("|/-\\")
+        stream = sys.stderr
         while not stop_event.wait(0.1):
-            sys.stderr.write(f"\r{message} {next(spinner)}")
-            sys.stderr.flush()
-        sys.stderr.write("\r" + " " * (len(message) + 2) + "\r")
-        sys.stderr.flush()
+            stream.write(next(frames))
+            stream.flush()
+        stream.write(blank)
+        stream.flush()
 
     thread = threading.Thread(target=_worker, daemon=True)
     thread.start()
@@ -99,20 +128,55 @@ def _ensure_venv() -> Path:
     return VENV_PYTHON
 
 
+def _pip_version(python_executable: Path) -> tuple[int, ...]:
+    """Return pip's version in ``python_executable`` without importing pip itself."""
+
+    completed = subprocess.run(
+        [str(python_executable), "-c", "import importlib.metadata as m; print(m.version('pip'))"],
+        cwd=BASE_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    parts = []
+    for part in completed.stdout.strip().split(".")[:2]:
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+def _requirements_fingerprint(python_executable: Path) -> str:
+    digest = hashlib.sha256(REQUIREMENTS_FILE.read_bytes())
+    digest.update(str(python_executable).encode())
+    return digest.hexdigest()
+
+
 def _install_requirements(python_executable: Path) -> None:
     """Install or update the required dependencies using ``python_executable``."""
 
     if not REQUIREMENTS_FILE.exists():
         raise FileNotFoundError("requirements.txt nicht gefunden")
 
-    print("[Installer] Aktualisiere pip …")
-    with _activity_indicator("[Installer] Bereite pip vor …"):
-        subprocess.run(
-            [str(python_executable), "-m", "pip", "install", "--upgrade", "pip"],
-            check=True,
-            cwd=BASE_DIR,
-            env=_build_env(),
-        )
+    fingerprint = _requirements_fingerprint(python_executable)
+    try:
+        if REQUIREMENTS_STAMP.read_text(encoding="ascii").strip() == fingerprint:
+            print("[Installer] Abhängigkeiten sind aktuell, überspringe pip.")
+            return
+    except OSError:
+        pass
+
+    PIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    env = _build_env()
+    if _pip_version(python_executable) < MIN_PIP_VERSION:
+        print("[Installer] Aktualisiere pip …")
+        with _activity_indicator("[Installer] Bereite pip vor …"):
+            subprocess.run(
+                [str(python_executable), "-m", "pip", "install", "--upgrade", *PIP_FLAGS, "pip"],
+                check=True,
+                cwd=BASE_DIR,
+                env=env,
+            )
 
     print("[Installer] Installiere Projekt-Abhängigkeiten …")
     with _activity_indicator("[Installer] Warte auf pip …"):
@@ -122,25 +186,21 @@ def _install_requirements(python_executable: Path) -> None:
                 "-m",
                 "pip",
                 "install",
+                *PIP_FLAGS,
                 "-r",
                 str(REQUIREMENTS_FILE),
             ],
             check=True,
             cwd=BASE_DIR,
-            env=_build_env(),
+            env=env,
         )
+    REQUIREMENTS_STAMP.write_text(fingerprint, encoding="ascii")
 
 
 def _ffmpeg_in_path() -> bool:
-    for binary in FFMPEG_BINARIES:
-        candidate = shutil.which(binary, path=os.pathsep.join(_PATH_PREFIXES + [os.environ.get("PATH", "")]))
-        if candidate:
-            continue
-        candidate = shutil.which(binary)
-        if candidate:
-            continue
-        return False
-    return True
+    # Der Suchpfad enthält PATH bereits; ein zweiter Lauf über PATH allein findet nichts Neues.
+    search_path = os.pathsep.join(_PATH_PREFIXES + [os.environ.get("PATH", "")])
+    return all(shutil.which(binary, path=search_path) for binary in FFMPEG_BINARIES)
 
 
 def _local_ffmpeg_dirs() -> list[Path]:
@@ -155,37 +215,176 @@ def _ffmpeg_exists_locally() -> bool:
     return bool(_local_ffmpeg_dirs())
 
 
-def _download_ffmpeg_windows(target_dir: Path) -> None:
-    url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
+class _RangesUnsupported(Exception):
+    """The server answered a byte-range request with something other than 206."""
+
+
+def _probe_download(url: str) -> tuple[str, int | None]:
+    """Return the final URL and its size if the server can serve byte ranges."""
+
+    from http.client import HTTPException
+    from urllib.request import Request, urlopen
+
+    # Manche Spiegel lehnen HEAD ab; dann bleibt nur der einfache Download.
+    try:
+        with urlopen(Request(url, method="HEAD")) as response:
+            final_url = response.geturl()
+            length = response.headers.get("Content-Length", "")
+            accept_ranges = response.headers.get("Accept-Ranges", "")
+    except (OSError, HTTPException):
+        return url, None
+    if accept_ranges.lower() != "bytes" or not length.isdigit():
+        return final_url, None
+    return final_url, int(length)
+
+
+def _download_range(url: str, path: Path, start: int, end: int) -> None:
+    from http.client import HTTPException
+    from urllib.request import Request, urlopen
+
+    for attempt in range(DOWNLOAD_ATTEMPTS):
+        try:
+            request = Request(url, headers={"Range": f"bytes={start}-{end}"})
+            with urlopen(request) as response, path.open("r+b") as fh:
+                if response.status != 206:
+                    raise _RangesUnsupported(response.status)
+                fh.seek(start)
+                shutil.copyfileobj(response, fh, DOWNLOAD_CHUNK)
+                if fh.tell() != end + 1:
+                    raise OSError(f"Download-Abschnitt {start}-{end} unvollständig")
+            return
+        except (OSError, HTTPException):
+            if attempt == DOWNLOAD_ATTEMPTS - 1:
+                raise
+
+
+def _download_stream(url: str, path: Path) -> None:
+    from urllib.request import urlopen
+
+    with urlopen(url) as response, path.open("wb") as fh:
+        shutil.copyfileobj(response, fh, DOWNLOAD_CHUNK)
+
+
+def _download_file(url: str, path: Path) -> None:
+    """Download ``url`` to ``path``, in parallel byte ranges where the server allows it.
+
+    Anything that goes wrong with the ranged download falls back to a single
+    plain GET, which is all the server has to support.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+    from http.client import HTTPException
+
+    final_url, size = _probe_download(url)
+    if not size:
+        _download_stream(final_url, path)
+        return
+
+    try:
+        with path.open("wb") as fh:
+            fh.truncate(size)
+        part = -(-size // DOWNLOAD_WORKERS)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            futures = [
+                pool.submit(_download_range, final_url, path, start, min(start + part, size) - 1)
+                for start in range(0, size, part)
+            ]
+            for future in futures:
+                future.result()
+    except (_RangesUnsupported, OSError, HTTPException):
+        _download_stream(final_url, path)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(DOWNLOAD_CHUNK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _published_sha256(url: str) -> str | None:
+    """Return the checksum gyan.dev publishes next to ``url``, if it can be fetched."""
+
+    from http.client import HTTPException
+    from urllib.request import urlopen
+
+    try:
+        with urlopen(url + ".sha256") as response:
+            return response.read().decode("ascii").split()[0].lower()
+    except (OSError, HTTPException, UnicodeDecodeError, IndexError):
+        return None
+
+
+def _fetch_ffmpeg_archive() -> Path:
+    """Return a verified FFmpeg archive, downloading it only if the cached copy is stale."""
+
+    archive_path = FFMPEG_CACHE_DIR / FFMPEG_URL.rsplit("/", 1)[-1]
+    expected = _published_sha256(FFMPEG_URL)
+    # Ohne Netz zur Prüfsumme wird der Cache so genommen, wie er ist.
+    if archive_path.exists() and expected in (None, _file_sha256(archive_path)):
+        print("[Installer] Verwende zwischengespeichertes FFmpeg-Archiv.")
+        return archive_path
+
+    FFMPEG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    partial_path = archive_path.with_name(archive_path.name + ".part")
     print("[Installer] Lade FFmpeg (Windows Essentials) herunter …")
-    with tempfile.TemporaryDirectory() as tmpdir:
-        archive_path = Path(tmpdir) / "ffmpeg.zip"
-        with urlopen(url) as response, archive_path.open("wb") as fh:
-            chunk = 1024 * 256
-            with _activity_indicator("[Installer] Download läuft …"):
-                while True:
-                    data = response.read(chunk)
-                    if not data:
-                        break
-                    fh.write(data)
-        with zipfile.ZipFile(archive_path) as zf:
-            members = [m for m in zf.namelist() if m.lower().endswith(tuple(name.lower() for name in FFMPEG_BINARIES))]
-            if not members:
-                raise RuntimeError("FFmpeg-Archiv enthält keine ausführbaren Dateien")
-            for member in members:
-                zf.extract(member, tmpdir)
-                extracted = Path(tmpdir) / member
-                target_dir.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(extracted, target_dir / extracted.name)
+    for _ in range(2):
+        with _activity_indicator("[Installer] Download läuft …"):
+            _download_file(FFMPEG_URL, partial_path)
+        if expected in (None, _file_sha256(partial_path)):
+            partial_path.replace(archive_path)
+            return archive_path
+    partial_path.unlink(missing_ok=True)
+    raise RuntimeError("FFmpeg-Archiv ist beschädigt (Prüfsumme stimmt nicht)")
+
+
+def _extract_ffmpeg(archive_path: Path, target_dir: Path) -> None:
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    with zipfile.ZipFile(archive_path) as zf:
+        wanted = frozenset(name.lower() for name in FFMPEG_BINARIES)
+        members = [m for m in zf.namelist() if m.rsplit("/", 1)[-1].lower() in wanted]
+        if not members:
+            raise RuntimeError("FFmpeg-Archiv enthält keine ausführbaren Dateien")
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        def _extract(member: str) -> None:
+            with zf.open(member) as src, (target_dir / Path(member).name).open("wb") as dst:
+                shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK)
+
+        # zlib gibt beim Entpacken den GIL frei, die Binaries entpacken so parallel.
+        with ThreadPoolExecutor(max_workers=len(members)) as pool:
+            list(pool.map(_extract, members))
+
+
+def _download_ffmpeg_windows(target_dir: Path) -> None:
+    import zipfile
+
+    for attempt in range(2):
+        archive_path = _fetch_ffmpeg_archive()
+        try:
+            _extract_ffmpeg(archive_path, target_dir)
+            break
+        except zipfile.BadZipFile:
+            # Ohne Prüfsumme kann ein kaputtes Archiv im Cache landen; es darf nicht bei
+            # jedem Start wieder verwendet werden.
+            archive_path.unlink(missing_ok=True)
+            if attempt:
+                raise
     print("[Installer] FFmpeg wurde installiert.")
 
 
 def _ensure_ffmpeg() -> None:
+    # Die lokalen Verzeichnisse kosten nur ein paar stat-Aufrufe, PATH dagegen einen pro Eintrag.
     local_dirs = _local_ffmpeg_dirs()
-    if _ffmpeg_in_path() or local_dirs:
+    if local_dirs:
         for directory in local_dirs:
             _prepend_path(directory)
         return
+    if _ffmpeg_in_path():
+        return
 
     if os.name == "nt":
         target_dir = VENV_BIN if VENV_BIN.exists() else FFMPEG_FALLBACK_DIR
@@ -240,7 +439,11 @@ def main() -> int:
         return 1
 
     print("[Starter] Neuer Versuch nach Installation …")
-    return _launch_application(python_to_use)
+    exit_code = _launch_application(python_to_use)
+    if exit_code != 0:
+        # Beim nächsten Start vollständig neu installieren statt dem Stempel zu vertrauen.
+        REQUIREMENTS_STAMP.unlink(missing_ok=True)
+    return exit_code
 
 
 if __name__ == "__main__":
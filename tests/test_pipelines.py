@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
 
 import pytest
@@ -22,6 +21,17 @@ def _base_options(tmp_path: Path) -> ProcessingOptions:
     )
 
 
+def _probe(path: Path) -> tuple[int, int, float]:
+    cap = cv2.VideoCapture(str(path))
+    try:
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        duration = cap.get(cv2.CAP_PROP_FRAME_COUNT) / cap.get(cv2.CAP_PROP_FPS)
+    finally:
+        cap.release()
+    return width, height, duration
+
+
 def test_process_image(tmp_path: Path) -> None:
     src = tmp_path / "img.jpg"
     arr = np.zeros((600, 800, 3), dtype=np.uint8)
@@ -31,76 +41,62 @@ def test_process_image(tmp_path: Path) -> None:
     assert result.target.exists()
     assert result.target.suffix == ".mp4"
 
-    probe = subprocess.run(
-        [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "v:0",
-            "-show_entries",
-            "stream=width,height",
-            "-of",
-            "csv=p=0",
-            str(result.target),
-        ],
-        stdout=subprocess.PIPE,
-        check=True,
-    )
-    width_out, height_out = map(int, probe.stdout.decode("utf-8").strip().split(","))
+    width_out, height_out, duration = _probe(result.target)
     assert width_out == options.size
     assert height_out == options.size
-
-    duration_probe = subprocess.run(
-        [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(result.target),
-        ],
-        stdout=subprocess.PIPE,
-        check=True,
-    )
-    duration = float(duration_probe.stdout.decode("utf-8").strip())
     assert 4.8 <= duration <= 5.2
 
 
-def test_process_video(tmp_path: Path) -> None:
-    src = tmp_path / "clip.mp4"
+def _write_clip(path: Path, frames: int = 5, fps: int = 5) -> None:
+    # Motion-JPEG in AVI is written by OpenCV itself, without an external encoder.
     width, height = 640, 360
-    fps = 5
-    writer = cv2.VideoWriter(str(src), cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
-    for i in range(5):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+    for i in range(frames):
         frame = np.zeros((height, width, 3), dtype=np.uint8)
         frame[:, :, 0] = i * 40
         writer.write(frame)
     writer.release()
 
+
+def test_process_video(tmp_path: Path) -> None:
+    src = tmp_path / "clip.avi"
+    _write_clip(src)
+
     options = _base_options(tmp_path)
     options.output_dir.mkdir(parents=True, exist_ok=True)
     result = process_video(src, options, None)
     assert result.target.exists()
 
-    probe = subprocess.run(
-        [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "v:0",
-            "-show_entries",
-            "stream=width,height",
-            "-of",
-            "csv=p=0",
-            str(result.target),
-        ],
-        stdout=subprocess.PIPE,
-        check=True,
-    )
-    width_out, height_out = map(int, probe.stdout.decode("utf-8").strip().split(","))
+    width_out, height_out, _ = _probe(result.target)
     assert width_out == options.size
     assert height_out == options.size
+
+
+def test_process_video_frame_pipe(tmp_path: Path) -> None:
+    # An explicit fps bypasses the ffmpeg crop filter, so every frame goes through
+    # the reader thread, the OpenCV crop/resize and the bgr24 pipe.
+    src = tmp_path / "clip.avi"
+    _write_clip(src)
+
+    options = _base_options(tmp_path)
+    options.fps = 5
+    options.output_dir.mkdir(parents=True, exist_ok=True)
+    result = process_video(src, options, None)
+    assert result.target.exists()
+
+    width_out, height_out, _ = _probe(result.target)
+    assert (width_out, height_out) == (options.size, options.size)
+
+    cap = cv2.VideoCapture(str(result.target))
+    frames = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(frame)
+    cap.release()
+    assert len(frames) == 5
+    # The last input frame is pure blue at 160; swapped channels would show up as red.
+    blue, green, red = frames[-1][options.size // 2, options.size // 2].astype(int)
+    assert abs(blue - 160) <= 12
+    assert green <= 12 and red <= 12